@@ -0,0 +1,34 @@
+"""Bulk offline re-extraction over the raw capture archive.
+
+Re-runs extraction, tagging and the Mongo upsert for every archived page body in a
+time range, without refetching anything. Typical use after fixing a selector:
+
+    python reprocess.py --from 2024-06-01 --to 2024-06-07 --source NDTV
+"""
+import asyncio
+from datetime import datetime
+from typing import List, Optional
+
+import typer
+
+from server import client, logger, reprocess_captures
+
+cli = typer.Typer(add_completion=False)
+
+@cli.command()
+def main(
+    start: datetime = typer.Option(..., "--from", help="Start of the capture time range (UTC)"),
+    end: Optional[datetime] = typer.Option(None, "--to", help="End of the capture time range (UTC), defaults to now"),
+    source: Optional[List[str]] = typer.Option(None, "--source", help="Only reprocess these sources"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Worker processes (defaults to CPU count)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Extract only, do not write to MongoDB"),
+):
+    """Re-extract and upsert archived captures fetched between --from and --to"""
+    try:
+        stats = asyncio.run(reprocess_captures(start, end or datetime.utcnow(), source, workers, dry_run))
+        logger.info(f"Reprocessing complete: {stats}")
+    finally:
+        client.close()
+
+if __name__ == "__main__":
+    cli()
@@ -1,4 +1,5 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -8,26 +9,106 @@ from pathlib import Path
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import httpx
 from bs4 import BeautifulSoup
 import re
 import asyncio
+import gzip
+import hashlib
+from urllib.parse import urlparse
+from collections import Counter, OrderedDict
+import zlib
+import numpy as np
+from scipy import sparse
+from concurrent.futures import ProcessPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 import json
-from bson import ObjectId
+import bson
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '0'))
+MONGO_BATCH_SIZE = int(os.environ.get('MONGO_BATCH_SIZE', '100'))
+client = AsyncIOMotorClient(mongo_url, maxPoolSize=MONGO_MAX_POOL_SIZE, minPoolSize=MONGO_MIN_POOL_SIZE)
 db = client[os.environ['DB_NAME']]
 
+# Fields the API returns for a news item - archive reads project to exactly these
+NEWS_FIELDS = (
+    "id", "title", "summary", "content", "state", "district", "category", "source", "url",
+    "published_at", "scraped_at", "is_global", "cluster_id"
+)
+NEWS_PROJECTION = {"_id": 0, **{field: 1 for field in NEWS_FIELDS}}
+
+# Raw capture archive - every fetched page body is kept compressed on disk so
+# extraction can be re-run later without refetching
+CAPTURE_DIR = Path(os.environ.get('CAPTURE_DIR', ROOT_DIR / 'captures'))
+CAPTURE_TIME_FORMAT = "%Y%m%dT%H%M%S%f"
+CAPTURE_SUFFIX = ".html.gz"
+REPROCESS_BATCH_FILES = int(os.environ.get('REPROCESS_BATCH_FILES', '64'))
+
+# Near-duplicate story clustering (MinHash signatures + LSH banding)
+DEDUP_NUM_PERM = 128
+DEDUP_BANDS = 32
+DEDUP_SHINGLE_SIZE = 5
+DEDUP_THRESHOLD = float(os.environ.get('DEDUP_THRESHOLD', '0.5'))
+DEDUP_WINDOW_HOURS = int(os.environ.get('DEDUP_WINDOW_HOURS', '72'))
+DEDUP_OVERFETCH = 4
+
+# Historical archive - one collection per calendar month of published_at, so
+# date-range queries only touch the months they cover and retention is enforced
+# by dropping whole partitions
+NEWS_PARTITION_PREFIX = "news_"
+NEWS_RETENTION_DAYS = int(os.environ.get('NEWS_RETENTION_DAYS', '365'))
+
+# Article body fetching - bounded overall concurrency plus a minimum delay
+# between requests to the same host
+ARTICLE_FETCH_CONCURRENCY = int(os.environ.get('ARTICLE_FETCH_CONCURRENCY', '8'))
+ARTICLE_HOST_DELAY_SECONDS = float(os.environ.get('ARTICLE_HOST_DELAY_SECONDS', '1.0'))
+ARTICLE_SUMMARY_SENTENCES = int(os.environ.get('ARTICLE_SUMMARY_SENTENCES', '3'))
+ARTICLE_FETCH_MAX_ATTEMPTS = int(os.environ.get('ARTICLE_FETCH_MAX_ATTEMPTS', '3'))
+
+# Materialized facet counters and daily digests, maintained at ingest time
+FACET_FIELDS = ("state", "category", "source")
+DIGEST_TOP_ITEMS = int(os.environ.get('DIGEST_TOP_ITEMS', '10'))
+
+# Trending terms - fixed-memory count-min sketches per time bucket. Each window
+# is (bucket size, buckets per window); a window is compared with the one before
+TRENDING_WINDOWS = {
+    "1h": (timedelta(minutes=5), 12),
+    "24h": (timedelta(hours=1), 24),
+    "7d": (timedelta(hours=6), 28)
+}
+TRENDING_SKETCH_WIDTH = int(os.environ.get('TRENDING_SKETCH_WIDTH', '2048'))
+TRENDING_SKETCH_DEPTH = 4
+TRENDING_CANDIDATES = 200
+TRENDING_SEEN_HEADLINES = 50000
+
+# Related articles - TF-IDF over titles and summaries of cached and archived items
+RELATED_MAX_DOCS = int(os.environ.get('RELATED_MAX_DOCS', '300000'))
+
+# Search-box autocomplete
+SUGGEST_TOP_K = 10
+SUGGEST_PLACE_WEIGHT = 25
+SUGGEST_FUZZY_ANCHOR = 2
+
+# Read-through cache for archive queries behind the state, search and feed endpoints
+QUERY_CACHE_SIZE = int(os.environ.get('QUERY_CACHE_SIZE', '1024'))
+QUERY_CACHE_TTL_SECONDS = float(os.environ.get('QUERY_CACHE_TTL_SECONDS', '300'))
+
 # Create the main app without a prefix
-app = FastAPI(title="Current Affairs API", description="Educational platform for UPSC and state-level exam preparation")
+app = FastAPI(
+    title="Current Affairs API",
+    description="Educational platform for UPSC and state-level exam preparation",
+    default_response_class=ORJSONResponse
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -83,6 +164,19 @@ NEWS_SOURCES = {
     ]
 }
 
+# Request headers shared by page and article fetches
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Common English words ignored by summaries and trending terms
+STOPWORDS = {
+    "the", "a", "an", "and", "or", "but", "of", "to", "in", "on", "at", "for", "with", "by", "from",
+    "is", "are", "was", "were", "be", "been", "has", "have", "had", "it", "its", "this", "that",
+    "as", "he", "she", "they", "his", "her", "their", "said", "will", "would", "not", "also",
+    "says", "after", "over", "amid", "into", "more", "than", "who", "what", "how", "why", "new"
+}
+
 # Define Models
 class NewsItem(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -111,22 +205,12 @@ news_cache = {
     "last_updated": datetime.utcnow()
 }
 
+# Background pipeline tasks (kept referenced until they finish)
+background_tasks = set()
+
 # Initialize scheduler
 scheduler = BackgroundScheduler()
 
-def serialize_doc(doc):
-    """Convert MongoDB document to JSON serializable format"""
-    if isinstance(doc, dict):
-        return {key: serialize_doc(value) for key, value in doc.items()}
-    elif isinstance(doc, list):
-        return [serialize_doc(item) for item in doc]
-    elif isinstance(doc, ObjectId):
-        return str(doc)
-    elif isinstance(doc, datetime):
-        return doc.isoformat()
-    else:
-        return doc
-
 def extract_state_district(text: str) -> tuple[Optional[str], Optional[str]]:
     """Extract state and district from news text using keyword matching"""
     text_lower = text.lower()
@@ -169,65 +253,1321 @@ def categorize_news(text: str) -> str:
     
     return "general"
 
+def title_shingles(title: str, size: int = DEDUP_SHINGLE_SIZE) -> set:
+    """Character shingles of a normalized title"""
+    text = " ".join(re.sub(r'[^a-z0-9]+', ' ', title.lower()).split())
+    if len(text) <= size:
+        return {text}
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+class StoryClusterIndex:
+    """Groups near-duplicate headlines from different sources into stories.
+    
+    Each title gets a MinHash signature over its shingles. Signatures are split
+    into bands and hashed into buckets, so finding candidate duplicates costs a
+    fixed number of dict lookups no matter how many stories are indexed.
+    Candidates are confirmed by their estimated Jaccard similarity, and stories
+    not seen for DEDUP_WINDOW_HOURS are evicted to keep memory bounded.
+    """
+    PRIME = (1 << 31) - 1
+    
+    def __init__(self, num_perm: int = DEDUP_NUM_PERM, bands: int = DEDUP_BANDS,
+                 threshold: float = DEDUP_THRESHOLD, window_hours: int = DEDUP_WINDOW_HOURS):
+        rng = np.random.default_rng(1)
+        self.perm_a = rng.integers(1, self.PRIME, size=num_perm, dtype=np.uint64)
+        self.perm_b = rng.integers(0, self.PRIME, size=num_perm, dtype=np.uint64)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.window = timedelta(hours=window_hours)
+        self.buckets: Dict[tuple, set] = {}
+        self.clusters: Dict[str, dict] = {}
+        self.latest = datetime.min
+    
+    def signature(self, title: str) -> np.ndarray:
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in title_shingles(title)),
+            dtype=np.uint64
+        ) % np.uint64(self.PRIME)
+        return ((np.outer(self.perm_a, hashes) + self.perm_b[:, None]) % np.uint64(self.PRIME)).min(axis=1)
+    
+    def band_keys(self, signature: np.ndarray) -> List[tuple]:
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+    
+    def assign(self, title: str, source: str, seen_at: datetime, cluster_id: Optional[str] = None) -> str:
+        """Return the story cluster for a headline, creating one if it is new"""
+        signature = self.signature(title)
+        keys = self.band_keys(signature)
+        
+        if cluster_id is None:
+            best_score = self.threshold
+            candidates = set().union(*(self.buckets.get(key, ()) for key in keys))
+            for candidate in candidates:
+                score = float(np.mean(self.clusters[candidate]["signature"] == signature))
+                if score >= best_score:
+                    cluster_id, best_score = candidate, score
+        
+        cluster = self.clusters.get(cluster_id) if cluster_id else None
+        if cluster is None:
+            cluster_id = cluster_id or str(uuid.uuid4())
+            cluster = {"signature": signature, "keys": keys, "sources": [], "last_seen": seen_at}
+            self.clusters[cluster_id] = cluster
+            for key in keys:
+                self.buckets.setdefault(key, set()).add(cluster_id)
+        
+        if source not in cluster["sources"]:
+            cluster["sources"].append(source)
+        cluster["last_seen"] = max(cluster["last_seen"], seen_at)
+        self.latest = max(self.latest, seen_at)
+        return cluster_id
+    
+    def sources(self, cluster_id: Optional[str]) -> List[str]:
+        cluster = self.clusters.get(cluster_id)
+        return list(cluster["sources"]) if cluster else []
+    
+    def evict_stale(self):
+        """Drop stories that have not been seen within the dedup window"""
+        # latest starts at datetime.min, which the window would underflow
+        if not self.clusters:
+            return
+        cutoff = self.latest - self.window
+        for cluster_id in [cid for cid, c in self.clusters.items() if c["last_seen"] < cutoff]:
+            for key in self.clusters.pop(cluster_id)["keys"]:
+                bucket = self.buckets.get(key)
+                if bucket is not None:
+                    bucket.discard(cluster_id)
+                    if not bucket:
+                        del self.buckets[key]
+
+story_index = StoryClusterIndex()
+
+def assign_story_clusters(items: List[dict]):
+    """Tag items with their near-duplicate story cluster at ingest time"""
+    for item in items:
+        item["cluster_id"] = story_index.assign(
+            item["title"], item["source"],
+            datetime.fromisoformat(item["scraped_at"]),
+            item.get("cluster_id")
+        )
+    story_index.evict_stale()
+
+def collapse_story_clusters(items: List[dict], limit: int) -> List[dict]:
+    """Keep one representative item per story cluster, listing every source that carried it"""
+    seen = set()
+    stories = []
+    for item in items:
+        cluster_id = item.get("cluster_id")
+        if cluster_id and cluster_id in seen:
+            continue
+        seen.add(cluster_id)
+        story = {k: v for k, v in item.items() if k != '_id'}
+        story["sources"] = story_index.sources(cluster_id) or [item["source"]]
+        stories.append(story)
+        if len(stories) >= limit:
+            break
+    return stories
+
+def headline_terms(title: str) -> set:
+    """Terms and multi-word entities mentioned in a headline"""
+    words = re.findall(r"[A-Za-z][A-Za-z0-9'-]*", title)
+    terms = {w.lower() for w in words if len(w) > 2 and w.lower() not in STOPWORDS}
+    
+    # Runs of capitalized words are entities, unless the whole headline is title case
+    capitalized = [w[0].isupper() for w in words]
+    if words and sum(capitalized) / len(words) < 0.6:
+        run = []
+        for word, is_capital in zip(words + [""], capitalized + [False]):
+            if is_capital:
+                run.append(word)
+                continue
+            if len(run) > 1:
+                terms.add(" ".join(run).lower())
+            run = []
+    return terms
+
+class CountMinSketch:
+    """Fixed-size frequency sketch - estimates never undercount.
+    
+    Rows use independent hashes: one 64-bit blake2b digest per key, mapped
+    through a different (a * h + b) mod p function for each row.
+    """
+    PRIME = (1 << 61) - 1
+    
+    def __init__(self, width: int = TRENDING_SKETCH_WIDTH, depth: int = TRENDING_SKETCH_DEPTH):
+        self.width = width
+        self.table = np.zeros((depth, width), dtype=np.int32)
+        self.rows = np.arange(depth)
+        rng = np.random.default_rng(depth)
+        self.hash_params = [
+            (int(a), int(b)) for a, b in zip(rng.integers(1, self.PRIME, size=depth), rng.integers(0, self.PRIME, size=depth))
+        ]
+    
+    def columns(self, key: str) -> np.ndarray:
+        h = int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+        return np.array([((a * h + b) % self.PRIME) % self.width for a, b in self.hash_params])
+    
+    def add(self, key: str, count: int = 1) -> int:
+        columns = self.columns(key)
+        self.table[self.rows, columns] += count
+        return int(self.table[self.rows, columns].min())
+    
+    def estimate(self, key: str) -> int:
+        return int(self.table[self.rows, self.columns(key)].min())
+
+class TrendingTracker:
+    """Rising terms per scope (overall and per state) over sliding windows.
+    
+    Every window keeps a ring of time buckets covering two window lengths. A
+    bucket holds a count-min sketch plus a capped set of heavy-hitter
+    candidates per scope, so memory is fixed however many headlines arrive.
+    Old buckets fall off the ring, which is what decays old counts.
+    """
+    
+    def __init__(self, windows: Dict[str, tuple] = TRENDING_WINDOWS):
+        self.windows = windows
+        self.buckets = {name: [] for name in windows}
+        self.seen = {}
+    
+    def bucket_for(self, window: str, when: datetime) -> Optional[dict]:
+        size, count = self.windows[window]
+        start = datetime.min + ((when - datetime.min) // size) * size
+        ring = self.buckets[window]
+        for bucket in reversed(ring):
+            if bucket["start"] == start:
+                return bucket
+            if bucket["start"] < start:
+                break
+        
+        # Too old to fall inside the ring any more
+        if ring and start <= ring[-1]["start"] - 2 * count * size:
+            return None
+        bucket = {"start": start, "sketch": CountMinSketch(), "candidates": {}}
+        ring.append(bucket)
+        ring.sort(key=lambda b: b["start"])
+        while ring[0]["start"] <= ring[-1]["start"] - 2 * count * size:
+            ring.pop(0)
+        return bucket
+    
+    def add(self, item: dict):
+        # Headlines stay on front pages across refreshes; count each one once
+        if item["id"] in self.seen:
+            return
+        self.seen[item["id"]] = True
+        if len(self.seen) > TRENDING_SEEN_HEADLINES:
+            del self.seen[next(iter(self.seen))]
+        
+        when = datetime.fromisoformat(item["scraped_at"])
+        scopes = ["all"] + ([item["state"]] if item.get("state") else [])
+        terms = headline_terms(item["title"])
+        for window in self.windows:
+            bucket = self.bucket_for(window, when)
+            if bucket is None:
+                continue
+            for scope in scopes:
+                candidates = bucket["candidates"].setdefault(scope, {})
+                for term in terms:
+                    candidates[term] = bucket["sketch"].add(f"{scope}|{term}")
+                if len(candidates) > 2 * TRENDING_CANDIDATES:
+                    keep = sorted(candidates.items(), key=lambda kv: kv[1], reverse=True)[:TRENDING_CANDIDATES]
+                    bucket["candidates"][scope] = dict(keep)
+    
+    def add_items(self, items: List[dict]):
+        for item in items:
+            self.add(item)
+    
+    def history(self) -> timedelta:
+        """How far back the rings reach - two lengths of the longest window"""
+        return max(2 * size * count for size, count in self.windows.values())
+    
+    def trending(self, window: str, scope: str = "all", limit: int = 20, now: Optional[datetime] = None) -> List[dict]:
+        """Terms ranked by how much they rose against the previous window"""
+        size, count = self.windows[window]
+        now = now or datetime.utcnow()
+        current_start = now - count * size
+        current = [b for b in self.buckets[window] if b["start"] > current_start]
+        previous = [b for b in self.buckets[window] if current_start - count * size < b["start"] <= current_start]
+        
+        candidates = set()
+        for bucket in current:
+            candidates.update(bucket["candidates"].get(scope, {}))
+        
+        results = []
+        for term in candidates:
+            key = f"{scope}|{term}"
+            mentions = sum(b["sketch"].estimate(key) for b in current)
+            before = sum(b["sketch"].estimate(key) for b in previous)
+            if mentions < 2 or mentions <= before:
+                continue
+            results.append({
+                "term": term,
+                "mentions": mentions,
+                "previous": before,
+                "score": round((mentions - before) / (before + 1) ** 0.5, 3)
+            })
+        
+        results.sort(key=lambda r: (r["score"], r["mentions"]), reverse=True)
+        return results[:limit]
+
+trending_tracker = TrendingTracker()
+
+def tfidf_tokens(text: str) -> Counter:
+    """Term counts used for the related-articles TF-IDF matrix"""
+    return Counter(w for w in re.findall(r"[a-z0-9][a-z0-9'-]+", text.lower()) if w not in STOPWORDS)
+
+class RelatedArticlesIndex:
+    """Sparse TF-IDF matrix over item titles and summaries for cosine "related" lookups.
+    
+    New items are appended as a CSR block of raw term counts, with document
+    frequencies updated from the block; items whose summary changes (once their
+    article body arrives) have their rows replaced. Re-weighting (a vectorized
+    pass over the non-zeros) builds a new snapshot off the event loop while
+    queries keep using the previous one, which is swapped out only when the new
+    one is ready. A snapshot also keeps a column-major copy, so a query is a
+    sparse product over just its own terms' columns plus argpartition for top-k.
+    Once over max_docs, the oldest rows are dropped.
+    """
+    DOC_FIELDS = ("id", "title", "summary", "source", "url", "state", "category", "published_at")
+    
+    def __init__(self, max_docs: int = RELATED_MAX_DOCS):
+        self.max_docs = max_docs
+        self.vocabulary: Dict[str, int] = {}
+        self.counts = sparse.csr_matrix((0, 0), dtype=np.float32)
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self.docs: List[dict] = []
+        self.rows: Dict[str, int] = {}
+        self.version = 0
+        self.served = None
+    
+    def __len__(self):
+        return len(self.docs)
+    
+    def count_rows(self, items: List[dict]) -> sparse.csr_matrix:
+        """Raw term counts for items, growing the vocabulary as needed"""
+        indptr, indices, data = [0], [], []
+        for item in items:
+            tokens = tfidf_tokens(f"{item.get('title', '')} {item.get('summary') or ''}")
+            for term, count in tokens.items():
+                indices.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                data.append(count)
+            indptr.append(len(indices))
+        
+        width = len(self.vocabulary)
+        # Existing matrices are rebuilt rather than resized in place, since a
+        # snapshot may be reading them from another thread
+        self.counts = sparse.csr_matrix(
+            (self.counts.data, self.counts.indices, self.counts.indptr), shape=(self.counts.shape[0], width)
+        )
+        self.doc_freq = np.concatenate([self.doc_freq, np.zeros(width - len(self.doc_freq), dtype=np.int64)])
+        return sparse.csr_matrix(
+            (np.array(data, dtype=np.float32), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int64)),
+            shape=(len(items), width)
+        )
+    
+    def add(self, items: List[dict]) -> int:
+        """Index items not seen before; returns how many were added"""
+        new_items = {}
+        for item in items:
+            if item["id"] not in self.rows:
+                new_items.setdefault(item["id"], item)
+        if not new_items:
+            return 0
+        
+        block = self.count_rows(list(new_items.values()))
+        for item in new_items.values():
+            self.rows[item["id"]] = len(self.docs)
+            self.docs.append({k: item.get(k) for k in self.DOC_FIELDS})
+        self.counts = sparse.vstack([self.counts, block], format="csr")
+        self.doc_freq = self.doc_freq + np.bincount(block.indices, minlength=block.shape[1])
+        
+        if len(self.docs) > self.max_docs:
+            self.trim(len(self.docs) - self.max_docs)
+        self.version += 1
+        return len(new_items)
+    
+    def update(self, items: List[dict]) -> int:
+        """Re-index items whose title or summary changed; returns how many were indexed"""
+        changed = {}
+        for item in items:
+            row = self.rows.get(item["id"])
+            if row is not None and self.docs[row]["summary"] != item.get("summary"):
+                changed[row] = item
+        if not changed:
+            return 0
+        
+        rows = np.array(sorted(changed), dtype=np.int64)
+        block = self.count_rows([changed[row] for row in rows])
+        old = self.counts[rows]
+        
+        # Zero out the old rows and add the new counts in their place
+        keep = np.ones(self.counts.shape[0], dtype=np.float32)
+        keep[rows] = 0
+        placed = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, np.arange(len(rows)))),
+            shape=(self.counts.shape[0], len(rows))
+        )
+        counts = (sparse.diags(keep).dot(self.counts) + placed.dot(block)).tocsr()
+        counts.eliminate_zeros()
+        self.counts = counts
+        self.doc_freq = (
+            self.doc_freq
+            - np.bincount(old.indices, minlength=block.shape[1])
+            + np.bincount(block.indices, minlength=block.shape[1])
+        )
+        for row, item in changed.items():
+            self.docs[row] = {k: item.get(k) for k in self.DOC_FIELDS}
+        self.version += 1
+        return len(changed)
+    
+    def trim(self, drop: int):
+        """Forget the oldest rows"""
+        dropped = self.counts[:drop]
+        self.doc_freq = self.doc_freq - np.bincount(dropped.indices, minlength=self.counts.shape[1])
+        self.counts = self.counts[drop:]
+        self.docs = self.docs[drop:]
+        self.rows = {doc["id"]: row for row, doc in enumerate(self.docs)}
+    
+    @staticmethod
+    def build_snapshot(version: int, counts: sparse.csr_matrix, doc_freq: np.ndarray, docs: List[dict]) -> dict:
+        """Weighted, L2-normalized matrices for one version of the index"""
+        idf = (np.log((1 + len(docs)) / (1 + doc_freq)) + 1).astype(np.float32)
+        matrix = counts.copy()
+        # Sublinear tf scaled by idf, then L2-normalized rows
+        matrix.data = (1 + np.log(matrix.data)) * idf[matrix.indices]
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        matrix = sparse.diags(1 / norms).dot(matrix).tocsr()
+        return {
+            "version": version,
+            "matrix": matrix,
+            # Column-major copy so a query only touches the postings of its own terms
+            "columns": matrix.tocsc(),
+            "docs": docs,
+            "rows": {doc["id"]: row for row, doc in enumerate(docs)}
+        }
+    
+    def snapshot_inputs(self) -> tuple:
+        # add/update/trim replace these objects instead of mutating them, so
+        # the thread building a snapshot sees a consistent version
+        return self.version, self.counts, self.doc_freq, list(self.docs)
+    
+    def install(self, snapshot: dict):
+        if self.served is None or snapshot["version"] > self.served["version"]:
+            self.served = snapshot
+    
+    async def reweight(self):
+        """Build a snapshot of the current index in a thread, then start serving it"""
+        if self.served is None or self.served["version"] != self.version:
+            self.install(await asyncio.to_thread(self.build_snapshot, *self.snapshot_inputs()))
+    
+    def reweight_now(self):
+        """Synchronous reweight, for offline use"""
+        self.install(self.build_snapshot(*self.snapshot_inputs()))
+    
+    def related(self, item_id: str, limit: int = 10) -> Optional[List[dict]]:
+        """Most similar items by cosine similarity, or None if the item is not being served yet"""
+        snapshot = self.served
+        row = snapshot["rows"].get(item_id) if snapshot else None
+        if row is None:
+            return None
+        
+        query = snapshot["matrix"][row]
+        scores = snapshot["columns"][:, query.indices].dot(query.data)
+        scores[row] = 0
+        limit = min(limit, len(scores) - 1)
+        if limit <= 0:
+            return []
+        
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [
+            {**snapshot["docs"][i], "similarity": round(float(scores[i]), 4)}
+            for i in top if scores[i] > 0
+        ]
+
+related_index = RelatedArticlesIndex()
+
+class SuggestionTrie:
+    """Prefix trie over headline terms and place names for search-box autocomplete.
+    
+    Every node caches the SUGGEST_TOP_K heaviest terms below it, so an exact
+    prefix is answered by walking len(prefix) nodes. Typos are handled with a
+    Levenshtein row carried down the trie, pruning any branch whose row
+    minimum already exceeds the allowed edits.
+    
+    Headline terms also record how much weight came from each archive
+    partition, so dropping a partition takes its weight back out.
+    """
+    
+    def __init__(self):
+        self.root = self.new_node()
+        self.terms: Dict[str, dict] = {}
+    
+    @staticmethod
+    def new_node() -> dict:
+        return {"children": {}, "top": []}
+    
+    def add(self, text: str, kind: str = "term", weight: int = 1, partition: Optional[str] = None):
+        key = text.lower()
+        entry = self.terms.get(key)
+        if entry is None:
+            entry = self.terms[key] = {"text": text, "kind": kind, "weight": 0, "partitions": Counter()}
+        elif kind != "term":
+            entry["text"], entry["kind"] = text, kind
+        entry["weight"] += weight
+        if partition:
+            entry["partitions"][partition] += weight
+        self.index(self.root, key, entry["weight"])
+    
+    def index(self, root: dict, key: str, weight: int):
+        node = root
+        for char in key:
+            self.update_top(node, key, weight)
+            node = node["children"].setdefault(char, self.new_node())
+        self.update_top(node, key, weight)
+    
+    @staticmethod
+    def update_top(node: dict, key: str, weight: int):
+        top = [t for t in node["top"] if t[1] != key]
+        if len(top) < SUGGEST_TOP_K or weight > top[-1][0]:
+            top.append((weight, key))
+            top.sort(key=lambda t: (-t[0], t[1]))
+            del top[SUGGEST_TOP_K:]
+        node["top"] = top
+    
+    def add_items(self, items: List[dict]):
+        for item in items:
+            partition = partition_name(datetime.fromisoformat(item["published_at"]))
+            for term in headline_terms(item["title"]):
+                self.add(term, partition=partition)
+    
+    def expire(self, partitions: set):
+        """Remove the weight dropped partitions contributed, then rebuild the cached top terms.
+        
+        Terms left with no weight are forgotten. The new trie is built aside
+        and swapped in, so suggestions keep working while this runs in a thread.
+        """
+        terms = {}
+        for key, entry in self.terms.items():
+            expired = sum(entry["partitions"][name] for name in partitions & entry["partitions"].keys())
+            if entry["weight"] - expired <= 0:
+                continue
+            kept = Counter({name: w for name, w in entry["partitions"].items() if name not in partitions})
+            terms[key] = {**entry, "weight": entry["weight"] - expired, "partitions": kept}
+        
+        # Old terms are a superset of the new ones, so swap the trie first
+        self.root = self.build(terms)
+        self.terms = terms
+    
+    def build(self, terms: Dict[str, dict]) -> dict:
+        """A trie over terms, filling each node's cached top terms from its children"""
+        root = self.new_node()
+        ends = []
+        for key, entry in terms.items():
+            node = root
+            for char in key:
+                child = node["children"].get(char)
+                if child is None:
+                    child = node["children"][char] = self.new_node()
+                node = child
+            ends.append((node, (entry["weight"], key)))
+        for node, term in ends:
+            node["top"].append(term)
+        
+        # Children before parents, so each node merges finished child lists
+        order = [root]
+        for node in order:
+            order.extend(node["children"].values())
+        for node in reversed(order):
+            candidates = node["top"] + [t for child in node["children"].values() for t in child["top"]]
+            candidates.sort(key=lambda t: (-t[0], t[1]))
+            node["top"] = candidates[:SUGGEST_TOP_K]
+        return root
+    
+    def fuzzy_nodes(self, key: str, max_edits: int) -> List[tuple]:
+        """Nodes whose path is within max_edits of the prefix, as (distance, node).
+        
+        The first SUGGEST_FUZZY_ANCHOR characters must match exactly - typos
+        rarely start a word, and anchoring keeps the search to a small subtree.
+        """
+        start = self.root
+        for char in key[:SUGGEST_FUZZY_ANCHOR]:
+            start = start["children"].get(char)
+            if start is None:
+                return []
+        key = key[SUGGEST_FUZZY_ANCHOR:]
+        
+        matches = []
+        first_row = list(range(len(key) + 1))
+        stack = [(child, char, first_row) for char, child in start["children"].items()]
+        while stack:
+            node, char, previous = stack.pop()
+            row = [previous[0] + 1]
+            for i in range(1, len(key) + 1):
+                row.append(min(row[i - 1] + 1, previous[i] + 1, previous[i - 1] + (key[i - 1] != char)))
+            if row[-1] <= max_edits:
+                # The node's cached top terms already cover its whole subtree
+                matches.append((row[-1], node))
+            # Keep going only while a deeper node could still match more closely
+            if min(row) <= max_edits and min(row) < row[-1]:
+                stack.extend((child, c, row) for c, child in node["children"].items())
+        return matches
+    
+    def suggest(self, prefix: str, limit: int = 8) -> List[dict]:
+        key = " ".join(prefix.lower().split())
+        if not key:
+            return []
+        
+        ranked = {}
+        node = self.root
+        for char in key:
+            node = node["children"].get(char)
+            if node is None:
+                break
+        else:
+            for weight, term in node["top"]:
+                ranked[term] = (0, -weight)
+        
+        # Only go fuzzy when exact prefix matches cannot fill the list
+        max_edits = 0 if len(key) < 4 else 1 if len(key) < 8 else 2
+        if len(ranked) < limit and max_edits:
+            for distance, match in self.fuzzy_nodes(key, max_edits):
+                for weight, term in match["top"]:
+                    if term not in ranked or ranked[term] > (distance, -weight):
+                        ranked[term] = (distance, -weight)
+        
+        best = sorted(ranked.items(), key=lambda kv: (kv[1], kv[0]))[:limit]
+        return [
+            {**{k: self.terms[term][k] for k in ("text", "kind")}, "distance": distance}
+            for term, (distance, _) in best
+        ]
+
+suggestion_trie = SuggestionTrie()
+for state_name, district_names in INDIAN_STATES_DISTRICTS.items():
+    suggestion_trie.add(state_name, "state", SUGGEST_PLACE_WEIGHT)
+    for district_name in district_names:
+        suggestion_trie.add(district_name, "district", SUGGEST_PLACE_WEIGHT)
+
+class QueryResultCache:
+    """LRU + TTL cache of archive query results with single-flight loading.
+    
+    Concurrent misses on the same key share one in-flight database call. Each
+    new cache snapshot bumps the generation, which clears stored results and
+    stops loads started before the snapshot from being stored.
+    """
+    
+    def __init__(self, max_entries: int = QUERY_CACHE_SIZE, ttl_seconds: float = QUERY_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl_seconds
+        self.entries: OrderedDict = OrderedDict()
+        self.inflight: Dict[tuple, asyncio.Future] = {}
+        self.generation = 0
+        self.counters = Counter()
+    
+    async def get_or_load(self, key: tuple, loader):
+        """Return the cached result for key, calling loader() at most once per miss"""
+        loop = asyncio.get_running_loop()
+        entry = self.entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > loop.time():
+                self.entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return value
+            del self.entries[key]
+            self.counters["expired"] += 1
+        
+        if key in self.inflight:
+            self.counters["collapsed"] += 1
+            inflight = self.inflight[key]
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The request that owned the load was cancelled, not this one
+                return await self.get_or_load(key, loader)
+        
+        self.counters["misses"] += 1
+        generation = self.generation
+        future = loop.create_future()
+        # Nobody may be waiting on the future, so mark its exception as seen
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self.inflight[key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            # Always resolve the shared future, or waiters would hang forever
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+        finally:
+            self.inflight.pop(key, None)
+        
+        if generation == self.generation:
+            self.entries[key] = (loop.time() + self.ttl, value)
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.counters["evictions"] += 1
+        future.set_result(value)
+        return value
+    
+    def invalidate(self):
+        """Drop every stored result - called whenever a new snapshot lands"""
+        self.generation += 1
+        self.entries.clear()
+        self.counters["invalidations"] += 1
+    
+    def stats(self) -> dict:
+        lookups = self.counters["hits"] + self.counters["misses"] + self.counters["collapsed"]
+        return {
+            "size": len(self.entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "generation": self.generation,
+            "hits": self.counters["hits"],
+            "misses": self.counters["misses"],
+            "collapsed": self.counters["collapsed"],
+            "expired": self.counters["expired"],
+            "evictions": self.counters["evictions"],
+            "invalidations": self.counters["invalidations"],
+            "hit_rate": round((self.counters["hits"] + self.counters["collapsed"]) / lookups, 4) if lookups else 0.0
+        }
+
+query_cache = QueryResultCache()
+
+def source_slug(source_name: str) -> str:
+    """Directory-safe key for a news source name"""
+    return re.sub(r'[^a-z0-9]+', '-', source_name.lower()).strip('-')
+
+def find_source(slug: str) -> tuple[Optional[dict], bool]:
+    """Look up a configured source (and whether it is global) by its slug"""
+    for group, sources in NEWS_SOURCES.items():
+        for source in sources:
+            if source_slug(source["name"]) == slug:
+                return source, group == "global"
+    return None, False
+
+def write_capture(source_name: str, body: str, fetched_at: datetime) -> Path:
+    """Store a compressed copy of a fetched page body in the capture archive"""
+    capture_dir = CAPTURE_DIR / source_slug(source_name)
+    capture_dir.mkdir(parents=True, exist_ok=True)
+    path = capture_dir / f"{fetched_at.strftime(CAPTURE_TIME_FORMAT)}{CAPTURE_SUFFIX}"
+    # 'x' mode refuses to overwrite, keeping the archive append-only
+    with gzip.open(path, 'xt', encoding='utf-8') as f:
+        f.write(body)
+    return path
+
+def list_capture_files(start: datetime, end: datetime, source_names: Optional[List[str]] = None) -> List[Path]:
+    """List archived captures fetched within [start, end], oldest first"""
+    if source_names:
+        slugs = [source_slug(name) for name in source_names]
+    else:
+        slugs = [source_slug(source["name"]) for sources in NEWS_SOURCES.values() for source in sources]
+    
+    paths = []
+    for slug in slugs:
+        capture_dir = CAPTURE_DIR / slug
+        if not capture_dir.is_dir():
+            continue
+        for path in capture_dir.glob(f"*{CAPTURE_SUFFIX}"):
+            try:
+                fetched_at = datetime.strptime(path.name[:-len(CAPTURE_SUFFIX)], CAPTURE_TIME_FORMAT)
+            except ValueError:
+                continue
+            if start <= fetched_at <= end:
+                paths.append((fetched_at, path))
+    
+    return [path for _, path in sorted(paths)]
+
+def news_item_id(source_name: str, title: str) -> str:
+    """Stable id for a headline, so re-scrapes and reprocessing map to the same archived item"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{source_name}|{title}"))
+
+def extract_news_items(html: str, source: dict, is_global: bool = False,
+                       scraped_at: Optional[datetime] = None) -> List[dict]:
+    """Extract, tag and serialize headline items from a source page body"""
+    news_items = []
+    soup = BeautifulSoup(html, 'html.parser')
+    headlines = soup.select(source["selector"])[:10]  # Limit to 10 articles per source
+    
+    for headline in headlines:
+        title = headline.get_text(strip=True)
+        if title and len(title) > 10:  # Filter out very short titles
+            # Get the link if available
+            link_elem = headline.find('a') or headline.find_parent('a')
+            url = None
+            if link_elem:
+                href = link_elem.get('href')
+                if href:
+                    if href.startswith('http'):
+                        url = href
+                    else:
+                        base_url = source["url"].split('/')[0] + '//' + source["url"].split('/')[2]
+                        url = base_url + href
+            
+            # Extract state and district for Indian news
+            state, district = None, None
+            if not is_global:
+                state, district = extract_state_district(title)
+            
+            # Categorize news
+            category = categorize_news(title)
+            
+            news_item = NewsItem(
+                id=news_item_id(source["name"], title),
+                title=title,
+                summary=title[:200] + "..." if len(title) > 200 else title,
+                state=state,
+                district=district,
+                category=category,
+                source=source["name"],
+                url=url,
+                is_global=is_global
+            )
+            if scraped_at:
+                # Reprocessed captures keep the time they were originally fetched
+                news_item.published_at = scraped_at
+                news_item.scraped_at = scraped_at
+            # Convert to dict and serialize datetime objects
+            item_dict = news_item.dict()
+            item_dict['published_at'] = item_dict['published_at'].isoformat()
+            item_dict['scraped_at'] = item_dict['scraped_at'].isoformat()
+            news_items.append(item_dict)
+    
+    return news_items
+
 async def scrape_news_from_source(source: dict, is_global: bool = False) -> List[NewsItem]:
     """Scrape news from a specific source"""
     news_items = []
     
     try:
         async with httpx.AsyncClient(timeout=30.0) as client:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = await client.get(source["url"], headers=headers)
+            response = await client.get(source["url"], headers=HEADERS)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                headlines = soup.select(source["selector"])[:10]  # Limit to 10 articles per source
+                # Keep the raw page so a broken selector can be backfilled later
+                try:
+                    await asyncio.to_thread(write_capture, source["name"], response.text, datetime.utcnow())
+                except Exception as e:
+                    logger.error(f"Error archiving capture from {source['name']}: {str(e)}")
                 
-                for headline in headlines:
-                    title = headline.get_text(strip=True)
-                    if title and len(title) > 10:  # Filter out very short titles
-                        # Get the link if available
-                        link_elem = headline.find('a') or headline.find_parent('a')
-                        url = None
-                        if link_elem:
-                            href = link_elem.get('href')
-                            if href:
-                                if href.startswith('http'):
-                                    url = href
-                                else:
-                                    base_url = source["url"].split('/')[0] + '//' + source["url"].split('/')[2]
-                                    url = base_url + href
-                        
-                        # Extract state and district for Indian news
-                        state, district = None, None
-                        if not is_global:
-                            state, district = extract_state_district(title)
-                        
-                        # Categorize news
-                        category = categorize_news(title)
-                        
-                        news_item = NewsItem(
-                            title=title,
-                            summary=title[:200] + "..." if len(title) > 200 else title,
-                            state=state,
-                            district=district,
-                            category=category,
-                            source=source["name"],
-                            url=url,
-                            is_global=is_global
-                        )
-                        # Convert to dict and serialize datetime objects
-                        item_dict = news_item.dict()
-                        item_dict['published_at'] = item_dict['published_at'].isoformat()
-                        item_dict['scraped_at'] = item_dict['scraped_at'].isoformat()
-                        news_items.append(item_dict)
+                news_items = extract_news_items(response.text, source, is_global)
+                for item in news_items:
+                    trending_tracker.add(item)
     
     except Exception as e:
         logger.error(f"Error scraping from {source['name']}: {str(e)}")
     
     return news_items
 
+def reprocess_capture_file(path: str) -> List[dict]:
+    """Re-run extraction and tagging over one archived capture (process pool worker)"""
+    capture_path = Path(path)
+    source, is_global = find_source(capture_path.parent.name)
+    if source is None:
+        return []
+    
+    fetched_at = datetime.strptime(capture_path.name[:-len(CAPTURE_SUFFIX)], CAPTURE_TIME_FORMAT)
+    with gzip.open(capture_path, 'rt', encoding='utf-8') as f:
+        html = f.read()
+    return extract_news_items(html, source, is_global, scraped_at=fetched_at)
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Normalize a possibly timezone-aware datetime to naive UTC, as stored in the archive"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def partition_name(value: datetime) -> str:
+    """Archive partition (monthly collection) holding items published at a given time"""
+    return f"{NEWS_PARTITION_PREFIX}{value.year:04d}{value.month:02d}"
+
+def previous_partition(name: str) -> str:
+    """Partition for the month before the given one"""
+    year, month = int(name[-6:-2]), int(name[-2:])
+    year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return f"{NEWS_PARTITION_PREFIX}{year:04d}{month:02d}"
+
+def partitions_for_range(start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[str]:
+    """Partitions overlapping [start, end] within the retention window, newest first"""
+    retention_start = datetime.utcnow() - timedelta(days=NEWS_RETENTION_DAYS)
+    start = max(to_utc_naive(start), retention_start) if start else retention_start
+    end = to_utc_naive(end) if end else datetime.utcnow()
+    
+    names = []
+    year, month = end.year, end.month
+    while (year, month) >= (start.year, start.month):
+        names.append(f"{NEWS_PARTITION_PREFIX}{year:04d}{month:02d}")
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return names
+
+def published_range_filter(start: Optional[datetime] = None, end: Optional[datetime] = None) -> dict:
+    """Mongo filter on published_at (stored as ISO strings) for a date range"""
+    bounds = {}
+    if start:
+        bounds["$gte"] = to_utc_naive(start).isoformat()
+    if end:
+        bounds["$lte"] = to_utc_naive(end).isoformat()
+    return {"published_at": bounds} if bounds else {}
+
+ensured_partitions = set()
+
+TEXT_INDEX_NAME = "text_search"
+TEXT_INDEX_FIELDS = ("title", "summary", "content")
+
+async def ensure_text_index(collection):
+    """Create the search text index, replacing an older one over different fields.
+    
+    A collection can only have one text index, and partitions created before
+    content was searchable carry an unnamed (title, summary) one.
+    """
+    async for index in collection.list_indexes():
+        if "_fts" in index["key"] and (index["name"] != TEXT_INDEX_NAME or set(index.get("weights", {})) != set(TEXT_INDEX_FIELDS)):
+            await collection.drop_index(index["name"])
+            logger.info(f"Dropped outdated text index {index['name']} on {collection.name}")
+    await collection.create_index([(field, "text") for field in TEXT_INDEX_FIELDS], name=TEXT_INDEX_NAME)
+
+async def get_partition(name: str):
+    """Get an archive partition, creating its indexes the first time it is written"""
+    collection = db[name]
+    if name not in ensured_partitions:
+        await collection.create_index("id", unique=True)
+        await collection.create_index([("is_global", 1), ("published_at", -1)])
+        await collection.create_index([("state", 1), ("published_at", -1)])
+        await collection.create_index("last_seen_at")
+        await ensure_text_index(collection)
+        ensured_partitions.add(name)
+    return collection
+
+async def find_archived_news(query: dict, limit: int, start: Optional[datetime] = None,
+                             end: Optional[datetime] = None) -> List[dict]:
+    """Newest-first archive lookup that only visits the partitions covering [start, end].
+    
+    Documents are projected to NEWS_FIELDS and fetched as raw BSON batches that
+    are decoded in one C call each. Stored items hold only strings, booleans and
+    nulls, so the decoded dicts are JSON-ready as they are.
+    """
+    query = {**query, **published_range_filter(start, end)}
+    results = []
+    for name in partitions_for_range(start, end):
+        remaining = limit - len(results)
+        cursor = (
+            db[name].find_raw_batches(query, NEWS_PROJECTION)
+            .sort("published_at", -1)
+            .limit(remaining)
+            .batch_size(min(remaining, MONGO_BATCH_SIZE))
+        )
+        async for batch in cursor:
+            results.extend(bson.decode_all(batch))
+        if len(results) >= limit:
+            break
+    return results[:limit]
+
+async def find_archived_stories(query: dict, limit: int, start: Optional[datetime] = None,
+                                end: Optional[datetime] = None) -> List[dict]:
+    """Archive lookup collapsed to up to `limit` distinct story clusters.
+    
+    Reads DEDUP_OVERFETCH times as many rows as stories wanted, and reads
+    further while duplicates still leave the page short.
+    """
+    fetch_limit = limit * DEDUP_OVERFETCH
+    for _ in range(3):
+        items = await find_archived_news(query, fetch_limit, start, end)
+        stories = collapse_story_clusters(items, limit)
+        if len(stories) >= limit or len(items) < fetch_limit:
+            break
+        fetch_limit *= DEDUP_OVERFETCH
+    return stories
+
+async def drop_expired_partitions():
+    """Enforce NEWS_RETENTION_DAYS by dropping partitions that ended before the cutoff"""
+    oldest_kept = partition_name(datetime.utcnow() - timedelta(days=NEWS_RETENTION_DAYS))
+    names = await db.list_collection_names(filter={"name": {"$regex": f"^{NEWS_PARTITION_PREFIX}\\d{{6}}$"}})
+    dropped = set()
+    for name in names:
+        if name < oldest_kept:
+            await db.drop_collection(name)
+            ensured_partitions.discard(name)
+            dropped.add(name)
+            logger.info(f"Dropped expired archive partition {name}")
+    
+    # Terms only seen in expired headlines should stop being suggested
+    if dropped:
+        await asyncio.to_thread(suggestion_trie.expire, dropped)
+
+async def upsert_news_items(items: List[dict]) -> List[dict]:
+    """Upsert news items into their archive partitions, refreshing their tags.
+    
+    Returns the items that were not archived before.
+    """
+    items_by_partition = {}
+    for item in items:
+        name = partition_name(datetime.fromisoformat(item["published_at"]))
+        # A headline repeated on one page must only be written once
+        items_by_partition.setdefault(name, {}).setdefault(item["id"], item)
+    
+    # Headlines still up after a month boundary stay in the partition that
+    # first archived them, so the new month doesn't get a second copy
+    for name in sorted(items_by_partition, reverse=True):
+        previous = previous_partition(name)
+        cursor = db[previous].find({"id": {"$in": list(items_by_partition[name])}}, {"_id": 0, "id": 1})
+        async for doc in cursor:
+            item = items_by_partition[name].pop(doc["id"])
+            items_by_partition.setdefault(previous, {}).setdefault(doc["id"], item)
+    
+    new_items = []
+    for name, partition_items in items_by_partition.items():
+        batch = list(partition_items.values())
+        if not batch:
+            continue
+        operations = []
+        for item in batch:
+            # Summaries are left alone once set, so body summaries survive re-scrapes;
+            # an item carrying its article body brings the stored row up to date
+            tags = {k: item.get(k) for k in ("state", "district", "category", "url")}
+            if item.get("content"):
+                tags.update(content=item["content"], summary=item["summary"])
+            first_seen = {k: v for k, v in item.items() if k not in tags and k != '_id'}
+            operations.append(UpdateOne(
+                {"id": item["id"]},
+                # last_seen_at only moves forward, so backfills don't rewind it
+                {"$set": tags, "$setOnInsert": first_seen, "$max": {"last_seen_at": item["scraped_at"]}},
+                upsert=True
+            ))
+        
+        collection = await get_partition(name)
+        result = await collection.bulk_write(operations, ordered=False)
+        new_items.extend(batch[index] for index in result.upserted_ids)
+    return new_items
+
+def facet_key(value: str) -> str:
+    """Make a facet value safe to use as a MongoDB field name"""
+    return value.replace(".", "_").replace("$", "_")
+
+async def record_facets(items: List[dict]):
+    """Incrementally update facet counters and daily digests for newly archived items.
+    
+    Counters live in facet_counts (one document overall, one per day) and
+    digests in daily_digests (one per day), so the read endpoints fetch a single
+    document instead of counting. Only the first item of each story cluster is
+    added to a digest's top items; every item is counted. Each digest keeps the
+    cluster ids it has listed, so a story reported again under a new item id
+    (an edited headline, another source) is not listed twice.
+    """
+    if not items:
+        return
+    
+    by_day = {}
+    for item in items:
+        by_day.setdefault(item["published_at"][:10], []).append(item)
+    
+    overall = Counter()
+    for day, day_items in by_day.items():
+        counts = Counter({"total": len(day_items)})
+        digest_counts = Counter()
+        digest_top = {}
+        digest = await db.daily_digests.find_one({"_id": day}, {"cluster_ids": 1})
+        stories_seen = set((digest or {}).get("cluster_ids", []))
+        new_stories = []
+        for item in day_items:
+            for field in FACET_FIELDS:
+                if item.get(field):
+                    counts[f"{field}.{facet_key(item[field])}"] += 1
+            
+            groups = [("categories", item.get("category"))]
+            if item.get("state"):
+                groups.append(("states", item["state"]))
+            
+            # A story's first report is the one that makes the digest
+            cluster_id = item.get("cluster_id")
+            is_new_story = cluster_id is None or cluster_id not in stories_seen
+            if is_new_story and cluster_id is not None:
+                stories_seen.add(cluster_id)
+                new_stories.append(cluster_id)
+            
+            for group, value in groups:
+                if not value:
+                    continue
+                path = f"{group}.{facet_key(value)}"
+                digest_counts[f"{path}.count"] += 1
+                if is_new_story:
+                    digest_top.setdefault(f"{path}.top", []).append(
+                        {k: item.get(k) for k in ("id", "title", "source", "url", "published_at", "cluster_id")}
+                    )
+        
+        overall.update(counts)
+        await db.facet_counts.update_one({"_id": day}, {"$inc": dict(counts)}, upsert=True)
+        digest_update = {
+            "$inc": {"total": len(day_items), **digest_counts},
+            "$set": {"updated_at": datetime.utcnow().isoformat()}
+        }
+        # Later reports of known stories add nothing to push, and older
+        # MongoDB versions reject an empty $push
+        if digest_top:
+            digest_update["$push"] = {
+                path: {"$each": entries, "$sort": {"published_at": -1}, "$slice": DIGEST_TOP_ITEMS}
+                for path, entries in digest_top.items()
+            }
+        if new_stories:
+            digest_update["$addToSet"] = {"cluster_ids": {"$each": new_stories}}
+        await db.daily_digests.update_one({"_id": day}, digest_update, upsert=True)
+    
+    await db.facet_counts.update_one({"_id": "all"}, {"$inc": dict(overall)}, upsert=True)
+
+async def reprocess_captures(start: datetime, end: datetime, source_names: Optional[List[str]] = None,
+                             workers: Optional[int] = None, dry_run: bool = False) -> Dict[str, int]:
+    """Re-extract, re-tag and upsert every archived capture in a time range.
+    
+    Parsing is spread across CPU cores with a process pool; files are handled in
+    batches so memory stays flat over long ranges.
+    """
+    paths = list_capture_files(start, end, source_names)
+    stats = {"files": len(paths), "items": 0, "inserted": 0}
+    loop = asyncio.get_running_loop()
+    
+    # Backfilled items should join the live stories rather than start new ones
+    await rebuild_story_index()
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for offset in range(0, len(paths), REPROCESS_BATCH_FILES):
+            batch = paths[offset:offset + REPROCESS_BATCH_FILES]
+            results = await asyncio.gather(*[
+                loop.run_in_executor(pool, reprocess_capture_file, str(path)) for path in batch
+            ])
+            items = [item for result in results for item in result]
+            assign_story_clusters(items)
+            stats["items"] += len(items)
+            if items and not dry_run:
+                # Bodies fetched since the capture go in with the item itself
+                await attach_article_bodies(items)
+                new_items = await upsert_news_items(items)
+                await record_facets(new_items)
+                stats["inserted"] += len(new_items)
+            logger.info(f"Reprocessed {offset + len(batch)}/{len(paths)} captures")
+    
+    return stats
+
+def extract_article_text(html: str) -> Optional[str]:
+    """Readability-style main text extraction.
+    
+    Paragraphs score their parent block by length and punctuation density (and
+    the grandparent by half of that); the best scoring block is taken as the
+    article body. Falls back to every paragraph on the page.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    for tag in soup(["script", "style", "noscript", "nav", "header", "footer", "aside", "form", "figure"]):
+        tag.decompose()
+    
+    # Keyed by id(): bs4 hashes a Tag by rendering its whole subtree, and
+    # compares tags by structure, so identical blocks would share a score
+    scores = {}
+    for paragraph in soup.find_all("p"):
+        text = paragraph.get_text(" ", strip=True)
+        if len(text) < 25:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        parent = paragraph.parent
+        if parent is not None:
+            scores.setdefault(id(parent), [parent, 0])[1] += score
+            if parent.parent is not None:
+                scores.setdefault(id(parent.parent), [parent.parent, 0])[1] += score / 2
+    
+    container = max(scores.values(), key=lambda entry: entry[1])[0] if scores else soup
+    paragraphs = [p.get_text(" ", strip=True) for p in container.find_all("p")]
+    text = "\n\n".join(p for p in paragraphs if len(p) >= 25)
+    return text or None
+
+def summarize_text(text: str, max_sentences: int = ARTICLE_SUMMARY_SENTENCES) -> str:
+    """Extractive summary - the highest scoring sentences by word frequency, in article order"""
+    sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+', text) if len(s.strip()) > 20]
+    if len(sentences) <= max_sentences:
+        return " ".join(sentences) or text[:200]
+    
+    frequencies = Counter(
+        word for word in re.findall(r"[a-z']+", text.lower()) if word not in STOPWORDS
+    )
+    
+    def score(sentence: str) -> float:
+        words = [w for w in re.findall(r"[a-z']+", sentence.lower()) if w not in STOPWORDS]
+        return sum(frequencies[w] for w in words) / (len(words) + 1)
+    
+    # Lead sentences usually carry the story, so give them a small boost
+    ranked = sorted(range(len(sentences)), key=lambda i: score(sentences[i]) * (1.5 if i < 2 else 1), reverse=True)
+    return " ".join(sentences[i] for i in sorted(ranked[:max_sentences]))
+
+async def attach_article_bodies(items: List[dict]) -> List[str]:
+    """Fill in content/summary from stored bodies; return item URLs that still need fetching.
+    
+    That is URLs never fetched before, plus ones whose earlier fetches failed
+    fewer than ARTICLE_FETCH_MAX_ATTEMPTS times. Bodies stored before failures
+    were counted are retried as if they had failed once.
+    """
+    urls = {item["url"] for item in items if item.get("url")}
+    if not urls:
+        return []
+    
+    bodies = {}
+    async for doc in db.article_bodies.find({"url": {"$in": list(urls)}}, {"_id": 0}):
+        bodies[doc["url"]] = doc
+    
+    for item in items:
+        body = bodies.get(item.get("url"))
+        if body and body.get("content"):
+            item["content"] = body["content"]
+            item["summary"] = body["summary"]
+    
+    done = {
+        url for url, body in bodies.items()
+        if body.get("content") or not 0 < body.get("failed_attempts", 1) < ARTICLE_FETCH_MAX_ATTEMPTS
+    }
+    return sorted(urls - done)
+
+async def fetch_article_bodies(urls: List[str]):
+    """Fetch, extract and store article bodies for newly seen URLs.
+    
+    Overall concurrency is capped by ARTICLE_FETCH_CONCURRENCY and requests to
+    a single host are spaced ARTICLE_HOST_DELAY_SECONDS apart. Failed fetches
+    (errors and non-200 responses) are counted in failed_attempts so later
+    refreshes retry them; pages fetched fine but with no extractable text are
+    not retried.
+    """
+    if not urls:
+        return
+    
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(ARTICLE_FETCH_CONCURRENCY)
+    host_locks = {}
+    host_next_slot = {}
+    stored = 0
+    updated_items = []
+    
+    async def fetch_one(http: httpx.AsyncClient, url: str):
+        nonlocal stored
+        host = urlparse(url).netloc
+        # Reserve the next politeness slot for this host
+        async with host_locks.setdefault(host, asyncio.Lock()):
+            wait = host_next_slot.get(host, 0) - loop.time()
+            host_next_slot[host] = max(loop.time(), host_next_slot.get(host, 0)) + ARTICLE_HOST_DELAY_SECONDS
+        if wait > 0:
+            await asyncio.sleep(wait)
+        
+        content, summary, failed = None, None, True
+        async with semaphore:
+            try:
+                response = await http.get(url, headers=HEADERS)
+                if response.status_code == 200:
+                    failed = False
+                    # Parsing is CPU bound, keep it off the event loop
+                    content = await asyncio.to_thread(extract_article_text, response.text)
+                else:
+                    logger.warning(f"Article fetch {url} returned {response.status_code}")
+            except Exception as e:
+                logger.error(f"Error fetching article {url}: {str(e)}")
+        
+        if content:
+            summary = await asyncio.to_thread(summarize_text, content)
+        
+        fetched_at = datetime.utcnow().isoformat()
+        if failed:
+            update = {"$inc": {"failed_attempts": 1}, "$set": {"fetched_at": fetched_at}}
+        else:
+            update = {"$set": {"content": content, "summary": summary, "failed_attempts": 0, "fetched_at": fetched_at}}
+        try:
+            # Only rows without a body are written, so a stored body is never replaced
+            await db.article_bodies.update_one({"url": url, "content": None}, update, upsert=True)
+        except DuplicateKeyError:
+            return
+        except Exception as e:
+            logger.error(f"Error storing article {url}: {str(e)}")
+            return
+        if content:
+            updated_items.extend(await apply_article_body(url, content, summary))
+            stored += 1
+    
+    await db.article_bodies.create_index("url", unique=True)
+    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as http:
+        await asyncio.gather(*[fetch_one(http, url) for url in urls])
+    logger.info(f"Fetched article bodies: {stored}/{len(urls)} extracted")
+    if related_index.update(updated_items):
+        await related_index.reweight()
+    if stored:
+        # Cached archive results may hold the old title-only summaries
+        query_cache.invalidate()
+
+async def apply_article_body(url: str, content: str, summary: str):
+    """Copy a fetched body onto the cached and archived items for its URL; returns the cached items"""
+    updated = []
+    for item in news_cache["global"] + news_cache["india"]:
+        if item.get("url") == url:
+            item["content"] = content
+            item["summary"] = summary
+            updated.append(item)
+    
+    # Newly seen URLs were archived in the last refresh, so the current
+    # partition (or the previous one just after a month boundary) holds them
+    for name in partitions_for_range(datetime.utcnow() - timedelta(days=1)):
+        await db[name].update_many({"url": url}, {"$set": {"content": content, "summary": summary}})
+    return updated
+
+def run_in_background(coro):
+    """Start a pipeline stage without blocking the caller"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+async def rebuild_story_index():
+    """Reload recently seen story clusters from MongoDB so cluster ids survive restarts.
+    
+    scraped_at is the first-seen time, so stories still on front pages are
+    found by last_seen_at instead. Headlines stay in the partition that first
+    archived them, which can be the month before the window starts.
+    """
+    since = (datetime.utcnow() - story_index.window).isoformat()
+    names = partitions_for_range(datetime.utcnow() - story_index.window)
+    names.append(previous_partition(names[-1]))
+    for name in reversed(names):
+        cursor = db[name].find(
+            {"$or": [{"last_seen_at": {"$gte": since}}, {"scraped_at": {"$gte": since}}], "cluster_id": {"$exists": True}},
+            {"_id": 0, "title": 1, "source": 1, "scraped_at": 1, "last_seen_at": 1, "cluster_id": 1}
+        )
+        async for doc in cursor:
+            seen_at = datetime.fromisoformat(doc.get("last_seen_at") or doc["scraped_at"])
+            story_index.assign(doc["title"], doc["source"], seen_at, doc["cluster_id"])
+
+async def rebuild_archive_indexes():
+    """Load the most recent archived items into the related-articles, autocomplete and trending indexes"""
+    docs = []
+    projection = {"_id": 0, "id": 1, "title": 1, "summary": 1, "source": 1, "url": 1,
+                  "state": 1, "category": 1, "published_at": 1}
+    for name in partitions_for_range():
+        remaining = related_index.max_docs - len(docs)
+        docs.extend(await db[name].find({}, projection).sort("published_at", -1).limit(remaining).to_list(remaining))
+        if len(docs) >= related_index.max_docs:
+            break
+    related_index.add(docs[::-1])
+    await related_index.reweight()
+    await asyncio.to_thread(suggestion_trie.add_items, docs)
+    
+    # Trending compares each window with the one before it, so it needs both
+    # back - otherwise every term looks like it is rising after a restart
+    since = datetime.utcnow() - trending_tracker.history()
+    recent = []
+    for name in reversed(partitions_for_range(since)):
+        recent.extend(await db[name].find(
+            {"scraped_at": {"$gte": since.isoformat()}},
+            {"_id": 0, "id": 1, "title": 1, "state": 1, "scraped_at": 1}
+        ).to_list(None))
+    recent.sort(key=lambda doc: doc["scraped_at"])
+    await asyncio.to_thread(trending_tracker.add_items, recent)
+    logger.info(f"Archive indexes loaded with {len(related_index)} items, {len(suggestion_trie.terms)} terms, "
+                f"{len(recent)} trending headlines")
+
 async def update_news_cache():
     """Update the news cache by scraping from all sources"""
     try:
@@ -247,26 +1587,30 @@ async def update_news_cache():
             indian_news = await scrape_news_from_source(source, is_global=False)
             news_cache["india"].extend(indian_news)
         
-        # Store in database
-        if news_cache["global"]:
-            await db.news.delete_many({"is_global": True})
-            # Clean items before storing (remove any _id fields)
-            clean_global = []
-            for item in news_cache["global"]:
-                clean_item = {k: v for k, v in item.items() if k != '_id'}
-                clean_global.append(clean_item)
-            await db.news.insert_many(clean_global)
-        
-        if news_cache["india"]:
-            await db.news.delete_many({"is_global": False})
-            # Clean items before storing (remove any _id fields)
-            clean_india = []
-            for item in news_cache["india"]:
-                clean_item = {k: v for k, v in item.items() if k != '_id'}
-                clean_india.append(clean_item)
-            await db.news.insert_many(clean_india)
+        # Group near-duplicate headlines across sources into stories
+        assign_story_clusters(news_cache["global"])
+        assign_story_clusters(news_cache["india"])
+        
+        # Article bodies: reuse stored ones (a new headline can point at an
+        # already fetched URL), fetch the rest in the background below
+        new_urls = await attach_article_bodies(news_cache["global"] + news_cache["india"])
+        
+        # Store in the historical archive - items already seen keep their
+        # first-seen fields, so history accumulates instead of being replaced
+        new_items = await upsert_news_items(news_cache["global"] + news_cache["india"])
+        await drop_expired_partitions()
+        
+        # Keep facet counters and daily digests current with what was added
+        await record_facets(new_items)
+        suggestion_trie.add_items(new_items)
+        
+        # Index with stored body summaries where known; new bodies re-index later
+        related_index.add(news_cache["global"] + news_cache["india"])
+        await related_index.reweight()
+        run_in_background(fetch_article_bodies(new_urls))
         
         news_cache["last_updated"] = datetime.utcnow()
+        query_cache.invalidate()
         logger.info(f"News cache updated successfully. Global: {len(news_cache['global'])}, India: {len(news_cache['india'])}")
         
     except Exception as e:
@@ -282,7 +1626,12 @@ async def root():
             "/api/news/global",
             "/api/news/india", 
             "/api/news/state/{state_name}",
-            "/api/news/search"
+            "/api/news/search",
+            "/api/news/facets",
+            "/api/digest/{date}",
+            "/api/news/trending",
+            "/api/news/{news_id}/related",
+            "/api/news/suggest"
         ]
     }
 
@@ -299,21 +1648,44 @@ async def debug_sample():
         return {"error": str(e)}
 
 @api_router.get("/news/global")
-async def get_global_news(limit: int = Query(20, ge=1, le=100)):
+async def get_global_news(
+    limit: int = Query(20, ge=1, le=100),
+    dedupe: bool = Query(False, description="Return one item per story, with all of its sources"),
+    from_: Optional[datetime] = Query(None, alias="from", description="Only items published at or after this time"),
+    to: Optional[datetime] = Query(None, description="Only items published at or before this time")
+):
     """Get latest global news"""
     try:
+        # Date ranges are served from the historical archive
+        if from_ or to:
+            # Duplicates are collapsed before the limit applies, not after
+            find = find_archived_stories if dedupe else find_archived_news
+            archived_news = await query_cache.get_or_load(
+                ("feed", True, limit, dedupe, from_, to),
+                lambda: find({"is_global": True}, limit, from_, to)
+            )
+            return ORJSONResponse({
+                "news": archived_news,
+                "total": len(archived_news),
+                "source": "archive",
+                "status": "success"
+            })
+        
         # Return from cache - clean any ObjectId fields
-        cached_news = []
-        for item in news_cache["global"][:limit]:
-            clean_item = {k: v for k, v in item.items() if k != '_id'}
-            cached_news.append(clean_item)
+        if dedupe:
+            cached_news = collapse_story_clusters(news_cache["global"], limit)
+        else:
+            cached_news = []
+            for item in news_cache["global"][:limit]:
+                clean_item = {k: v for k, v in item.items() if k != '_id'}
+                cached_news.append(clean_item)
             
-        return {
+        return ORJSONResponse({
             "news": cached_news, 
             "total": len(cached_news), 
             "source": "cache",
             "status": "success"
-        }
+        })
     
     except Exception as e:
         logger.error(f"Error fetching global news: {str(e)}")
@@ -325,21 +1697,44 @@ async def get_global_news(limit: int = Query(20, ge=1, le=100)):
         }
 
 @api_router.get("/news/india")
-async def get_india_news(limit: int = Query(20, ge=1, le=100)):
+async def get_india_news(
+    limit: int = Query(20, ge=1, le=100),
+    dedupe: bool = Query(False, description="Return one item per story, with all of its sources"),
+    from_: Optional[datetime] = Query(None, alias="from", description="Only items published at or after this time"),
+    to: Optional[datetime] = Query(None, description="Only items published at or before this time")
+):
     """Get latest India news"""
     try:
+        # Date ranges are served from the historical archive
+        if from_ or to:
+            # Duplicates are collapsed before the limit applies, not after
+            find = find_archived_stories if dedupe else find_archived_news
+            archived_news = await query_cache.get_or_load(
+                ("feed", False, limit, dedupe, from_, to),
+                lambda: find({"is_global": False}, limit, from_, to)
+            )
+            return ORJSONResponse({
+                "news": archived_news,
+                "total": len(archived_news),
+                "source": "archive",
+                "status": "success"
+            })
+        
         # Return from cache - clean any ObjectId fields
-        cached_news = []
-        for item in news_cache["india"][:limit]:
-            clean_item = {k: v for k, v in item.items() if k != '_id'}
-            cached_news.append(clean_item)
+        if dedupe:
+            cached_news = collapse_story_clusters(news_cache["india"], limit)
+        else:
+            cached_news = []
+            for item in news_cache["india"][:limit]:
+                clean_item = {k: v for k, v in item.items() if k != '_id'}
+                cached_news.append(clean_item)
             
-        return {
+        return ORJSONResponse({
             "news": cached_news, 
             "total": len(cached_news), 
             "source": "cache",
             "status": "success"
-        }
+        })
     
     except Exception as e:
         logger.error(f"Error fetching India news: {str(e)}")
@@ -351,7 +1746,12 @@ async def get_india_news(limit: int = Query(20, ge=1, le=100)):
         }
 
 @api_router.get("/news/state/{state_name}")
-async def get_state_news(state_name: str, limit: int = Query(20, ge=1, le=100)):
+async def get_state_news(
+    state_name: str,
+    limit: int = Query(20, ge=1, le=100),
+    from_: Optional[datetime] = Query(None, alias="from", description="Only items published at or after this time"),
+    to: Optional[datetime] = Query(None, description="Only items published at or before this time")
+):
     """Get news filtered by Indian state"""
     try:
         # Format state name
@@ -360,26 +1760,30 @@ async def get_state_news(state_name: str, limit: int = Query(20, ge=1, le=100)):
         if state_name not in INDIAN_STATES_DISTRICTS:
             raise HTTPException(status_code=404, detail=f"State '{state_name}' not found")
         
-        # Search in cache first
-        state_news = [
-            item for item in news_cache["india"] 
-            if item.get("state") == state_name
-        ][:limit]
+        # Search in cache first, unless a date range asks for history
+        state_news = []
+        if not (from_ or to):
+            state_news = [
+                item for item in news_cache["india"] 
+                if item.get("state") == state_name
+            ][:limit]
         
         if not state_news:
-            # Search in database
-            state_news_db = await db.news.find({
-                "is_global": False,
-                "state": state_name
-            }).sort("published_at", -1).limit(limit).to_list(limit)
-            state_news = [serialize_doc(doc) for doc in state_news_db]
+            # Search in the archive partitions covering the range
+            state_news = await query_cache.get_or_load(
+                ("state", state_name, limit, from_, to),
+                lambda: find_archived_news({
+                    "is_global": False,
+                    "state": state_name
+                }, limit, from_, to)
+            )
         
-        return {
+        return ORJSONResponse({
             "news": state_news, 
             "total": len(state_news), 
             "state": state_name,
             "districts": INDIAN_STATES_DISTRICTS[state_name]
-        }
+        })
     
     except HTTPException:
         raise
@@ -392,7 +1796,9 @@ async def search_news(
     q: str = Query(..., description="Search keyword"),
     limit: int = Query(20, ge=1, le=100),
     state: Optional[str] = Query(None, description="Filter by state"),
-    category: Optional[str] = Query(None, description="Filter by category")
+    category: Optional[str] = Query(None, description="Filter by category"),
+    from_: Optional[datetime] = Query(None, alias="from", description="Only items published at or after this time"),
+    to: Optional[datetime] = Query(None, description="Only items published at or before this time")
 ):
     """Search news by keywords with optional filters"""
     try:
@@ -412,47 +1818,162 @@ async def search_news(
             **search_filter
         }
         
-        # Try to create text index if it doesn't exist
-        try:
-            await db.news.create_index([("title", "text"), ("summary", "text")])
-        except:
-            pass  # Index might already exist
-        
-        search_results = await db.news.find(db_query).sort("published_at", -1).limit(limit).to_list(limit)
-        search_results = [serialize_doc(doc) for doc in search_results]
+        # Every archive partition carries its own text index
+        search_results = await query_cache.get_or_load(
+            ("search", " ".join(q.lower().split()), state, search_filter.get("category"), limit, from_, to),
+            lambda: find_archived_news(db_query, limit, from_, to)
+        )
         
         # If no results from database, search in cache
         if not search_results:
             all_cached_news = news_cache["global"] + news_cache["india"]
             search_results = []
+            published_after = to_utc_naive(from_).isoformat() if from_ else ""
+            published_before = to_utc_naive(to).isoformat() if to else None
             
             q_lower = q.lower()
             for item in all_cached_news:
                 if (q_lower in item.get("title", "").lower() or 
-                    q_lower in item.get("summary", "").lower()):
+                    q_lower in item.get("summary", "").lower() or
+                    q_lower in (item.get("content") or "").lower()):
                     
                     # Apply filters
                     if state and item.get("state") != state:
                         continue
                     if category and item.get("category") != category.lower():
                         continue
+                    if item["published_at"] < published_after:
+                        continue
+                    if published_before and item["published_at"] > published_before:
+                        continue
                     
                     search_results.append(item)
                     
                     if len(search_results) >= limit:
                         break
         
-        return {
+        return ORJSONResponse({
             "news": search_results,
             "total": len(search_results),
             "query": q,
-            "filters": {"state": state, "category": category}
-        }
+            "filters": {"state": state, "category": category, "from": from_, "to": to}
+        })
     
     except Exception as e:
         logger.error(f"Error searching news: {str(e)}")
         raise HTTPException(status_code=500, detail="Error searching news")
 
+@api_router.get("/news/facets")
+async def get_news_facets(date: Optional[str] = Query(None, description="Day (YYYY-MM-DD), defaults to all time")):
+    """Get item counts by state, category and source from the materialized counters"""
+    if date:
+        try:
+            datetime.strptime(date, "%Y-%m-%d")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Date must be in YYYY-MM-DD format")
+    
+    try:
+        doc = await db.facet_counts.find_one({"_id": date or "all"}) or {}
+        return {
+            "date": date,
+            "total": doc.get("total", 0),
+            **{field: doc.get(field, {}) for field in FACET_FIELDS}
+        }
+    
+    except Exception as e:
+        logger.error(f"Error fetching facets: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error fetching facets")
+
+@api_router.get("/digest/{date}")
+async def get_daily_digest(date: str):
+    """Get the precomputed daily digest of top items and counts per state and category"""
+    try:
+        datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Date must be in YYYY-MM-DD format")
+    
+    try:
+        doc = await db.daily_digests.find_one({"_id": date}, {"cluster_ids": 0})
+    except Exception as e:
+        logger.error(f"Error fetching digest: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error fetching digest")
+    
+    if not doc:
+        raise HTTPException(status_code=404, detail=f"No digest for {date}")
+    
+    return {
+        "date": date,
+        "total": doc.get("total", 0),
+        "states": doc.get("states", {}),
+        "categories": doc.get("categories", {}),
+        "updated_at": doc.get("updated_at")
+    }
+
+@api_router.get("/news/trending")
+async def get_trending_news(
+    window: str = Query("24h", description="Sliding window: 1h, 24h or 7d"),
+    state: Optional[str] = Query(None, description="Only headlines tagged with this state"),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """Get terms and entities rising in recent headlines, overall or per state"""
+    if window not in TRENDING_WINDOWS:
+        raise HTTPException(status_code=400, detail=f"Window must be one of {', '.join(TRENDING_WINDOWS)}")
+    
+    if state:
+        state = state.replace("-", " ").title()
+        if state not in INDIAN_STATES_DISTRICTS:
+            raise HTTPException(status_code=404, detail=f"State '{state}' not found")
+    
+    try:
+        trending = trending_tracker.trending(window, state or "all", limit)
+        return {
+            "trending": trending,
+            "total": len(trending),
+            "window": window,
+            "state": state
+        }
+    
+    except Exception as e:
+        logger.error(f"Error fetching trending terms: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error fetching trending terms")
+
+@api_router.get("/news/suggest")
+async def suggest_search_terms(
+    prefix: str = Query(..., min_length=1, max_length=50, description="What has been typed so far"),
+    limit: int = Query(8, ge=1, le=SUGGEST_TOP_K)
+):
+    """Autocomplete search terms, state and district names, tolerating small typos"""
+    try:
+        suggestions = suggestion_trie.suggest(prefix, limit)
+        return {"suggestions": suggestions, "prefix": prefix}
+    
+    except Exception as e:
+        logger.error(f"Error suggesting search terms: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error suggesting search terms")
+
+@api_router.get("/news/{news_id}/related")
+async def get_related_news(news_id: str, limit: int = Query(10, ge=1, le=50)):
+    """Get articles related to a news item by TF-IDF cosine similarity"""
+    try:
+        related = related_index.related(news_id, limit)
+    except Exception as e:
+        logger.error(f"Error fetching related news: {str(e)}")
+        raise HTTPException(status_code=500, detail="Error fetching related news")
+    
+    if related is None:
+        raise HTTPException(status_code=404, detail=f"News item '{news_id}' not found")
+    
+    return {
+        "news": related,
+        "total": len(related),
+        "id": news_id
+    }
+
+@api_router.get("/cache/stats")
+async def get_cache_stats():
+    """Get hit/miss statistics for the archive query result cache"""
+    return query_cache.stats()
+
 @api_router.get("/states")
 async def get_states():
     """Get list of all Indian states and their districts"""
@@ -496,6 +2017,16 @@ async def startup_event():
     """Initialize the application"""
     logger.info("Starting Current Affairs API...")
     
+    try:
+        await rebuild_story_index()
+    except Exception as e:
+        logger.error(f"Error rebuilding story index: {str(e)}")
+    
+    try:
+        await rebuild_archive_indexes()
+    except Exception as e:
+        logger.error(f"Error rebuilding archive indexes: {str(e)}")
+    
     # Update news cache on startup
     await update_news_cache()
     
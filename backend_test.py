@@ -302,6 +302,151 @@ class TestCurrentAffairsAPI:
         
         print(f"✅ Data structure and integrity test passed for {len(all_news)} news items")
     
+    def test_deduplicated_feed(self):
+        """Test collapsing near-duplicate stories in the India feed"""
+        response = requests.get(f"{API_BASE_URL}/news/india?dedupe=true")
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["status"] == "success"
+        assert len(data["news"]) == data["total"]
+        
+        # Each story appears once and lists every source that carried it
+        cluster_ids = [item["cluster_id"] for item in data["news"]]
+        assert len(cluster_ids) == len(set(cluster_ids))
+        for item in data["news"]:
+            assert item["source"] in item["sources"]
+        
+        print(f"✅ Deduplicated feed test passed with {data['total']} stories")
+    
+    def test_date_range_queries(self):
+        """Test from/to date-range queries against the historical archive"""
+        params = {"from": "2024-01-01T00:00:00", "to": datetime.utcnow().isoformat()}
+        
+        response = requests.get(f"{API_BASE_URL}/news/india", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["source"] == "archive"
+        for item in data["news"]:
+            assert params["from"] <= item["published_at"] <= params["to"]
+        
+        response = requests.get(f"{API_BASE_URL}/news/state/Kerala", params=params)
+        assert response.status_code == 200
+        for item in response.json()["news"]:
+            assert item["state"] == "Kerala"
+        
+        response = requests.get(f"{API_BASE_URL}/news/search", params={"q": "election", **params})
+        assert response.status_code == 200
+        assert response.json()["filters"]["from"] is not None
+        
+        print(f"✅ Date range query test passed with {data['total']} archived articles")
+    
+    def test_facets_and_digest_endpoints(self):
+        """Test the materialized facet counts and daily digest endpoints"""
+        response = requests.get(f"{API_BASE_URL}/news/facets")
+        assert response.status_code == 200
+        data = response.json()
+        for field in ["total", "state", "category", "source"]:
+            assert field in data
+        assert data["total"] >= sum(data["source"].values())
+        
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        response = requests.get(f"{API_BASE_URL}/digest/{today}")
+        assert response.status_code in [200, 404]
+        if response.status_code == 200:
+            digest = response.json()
+            for group in ["states", "categories"]:
+                for value in digest[group].values():
+                    assert "count" in value
+        
+        response = requests.get(f"{API_BASE_URL}/digest/not-a-date")
+        assert response.status_code == 400
+        
+        print(f"✅ Facets and digest test passed with {data['total']} counted articles")
+    
+    def test_trending_endpoint(self):
+        """Test the trending terms endpoint for each window"""
+        for window in ["1h", "24h", "7d"]:
+            response = requests.get(f"{API_BASE_URL}/news/trending", params={"window": window})
+            assert response.status_code == 200
+            data = response.json()
+            assert data["window"] == window
+            assert len(data["trending"]) == data["total"]
+            for entry in data["trending"]:
+                assert entry["mentions"] > entry["previous"]
+        
+        response = requests.get(f"{API_BASE_URL}/news/trending", params={"state": "Kerala"})
+        assert response.status_code == 200
+        assert response.json()["state"] == "Kerala"
+        
+        response = requests.get(f"{API_BASE_URL}/news/trending", params={"window": "2d"})
+        assert response.status_code == 400
+        
+        print(f"✅ Trending endpoint test passed")
+    
+    def test_related_endpoint(self):
+        """Test the related articles endpoint"""
+        response = requests.get(f"{API_BASE_URL}/news/india")
+        assert response.status_code == 200
+        news = response.json()["news"]
+        
+        if news:
+            response = requests.get(f"{API_BASE_URL}/news/{news[0]['id']}/related", params={"limit": 5})
+            assert response.status_code == 200
+            data = response.json()
+            assert data["id"] == news[0]["id"]
+            assert len(data["news"]) <= 5
+            similarities = [item["similarity"] for item in data["news"]]
+            assert similarities == sorted(similarities, reverse=True)
+            assert all(item["id"] != news[0]["id"] for item in data["news"])
+        
+        response = requests.get(f"{API_BASE_URL}/news/unknown-id/related")
+        assert response.status_code == 404
+        
+        print(f"✅ Related articles test passed")
+    
+    def test_suggest_endpoint(self):
+        """Test search-box autocomplete, including typo tolerance"""
+        response = requests.get(f"{API_BASE_URL}/news/suggest", params={"prefix": "Tamil"})
+        assert response.status_code == 200
+        suggestions = response.json()["suggestions"]
+        assert any(s["text"] == "Tamil Nadu" and s["kind"] == "state" for s in suggestions)
+        
+        # One letter short of the district name
+        response = requests.get(f"{API_BASE_URL}/news/suggest", params={"prefix": "Tiruchirapalli"})
+        assert response.status_code == 200
+        suggestions = response.json()["suggestions"]
+        assert any(s["text"] == "Tiruchirappalli" for s in suggestions)
+        
+        response = requests.get(f"{API_BASE_URL}/news/suggest")
+        assert response.status_code == 422
+        
+        print(f"✅ Suggest endpoint test passed")
+    
+    def test_cache_stats_endpoint(self):
+        """Test that repeated archive queries are served from the result cache"""
+        # A refresh between the two searches clears the cache, so retry until
+        # a pair of searches lands within one cache generation
+        for attempt in range(3):
+            before = requests.get(f"{API_BASE_URL}/cache/stats").json()
+            
+            # The same normalized search twice
+            requests.get(f"{API_BASE_URL}/news/search", params={"q": "Election"})
+            requests.get(f"{API_BASE_URL}/news/search", params={"q": "  election "})
+            
+            response = requests.get(f"{API_BASE_URL}/cache/stats")
+            assert response.status_code == 200
+            after = response.json()
+            if after["generation"] == before["generation"]:
+                break
+        
+        for field in ["size", "hits", "misses", "collapsed", "hit_rate", "generation"]:
+            assert field in after
+        assert after["generation"] == before["generation"]
+        assert after["hits"] + after["collapsed"] > before["hits"] + before["collapsed"]
+        
+        print(f"✅ Cache stats test passed with hit rate {after['hit_rate']}")
+    
     def test_error_handling(self):
         """Test error handling for invalid requests"""
         # Test invalid endpoint
@@ -335,6 +480,13 @@ if __name__ == "__main__":
         test_instance.test_states_endpoint,
         test_instance.test_refresh_endpoint,
         test_instance.test_data_structure_and_integrity,
+        test_instance.test_deduplicated_feed,
+        test_instance.test_date_range_queries,
+        test_instance.test_facets_and_digest_endpoints,
+        test_instance.test_trending_endpoint,
+        test_instance.test_related_endpoint,
+        test_instance.test_suggest_endpoint,
+        test_instance.test_cache_stats_endpoint,
         test_instance.test_error_handling
     ]
     
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark the per-document cost of the archive read path, before and after.
+
+Before: full documents decoded to dicts (the default Motor cursor), then
+serialize_doc (the server's old converter, copied below), FastAPI's
+jsonable_encoder and json.dumps (what JSONResponse does). After: documents projected to NEWS_FIELDS, decoded a whole raw BSON batch
+at a time, and encoded straight to bytes by orjson (ORJSONResponse).
+
+No database is needed - batches are built locally with the bson package that
+ships with pymongo. Run from the repository root:
+
+    python benchmarks/bench_read_path.py
+    python benchmarks/bench_read_path.py --docs 100 --content-chars 0
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import bson
+import orjson
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "benchmark")
+
+from server import NEWS_FIELDS  # noqa: E402
+
+def serialize_doc(doc):
+    """The server's former per-document converter, kept here as the baseline"""
+    if isinstance(doc, dict):
+        return {key: serialize_doc(value) for key, value in doc.items()}
+    elif isinstance(doc, list):
+        return [serialize_doc(item) for item in doc]
+    elif isinstance(doc, ObjectId):
+        return str(doc)
+    elif isinstance(doc, datetime):
+        return doc.isoformat()
+    else:
+        return doc
+
+def stored_document(content_chars: int) -> dict:
+    now = datetime.utcnow().isoformat()
+    return {
+        "_id": ObjectId(),
+        "id": str(uuid.uuid4()),
+        "title": "Heavy rain in Kerala, Kochi schools shut on Monday as IMD issues red alert",
+        "summary": "The India Meteorological Department issued a red alert for Kochi. " * 3,
+        "content": ("Schools and colleges in Kochi remain shut as heavy rain continues. " * 200)[:content_chars] or None,
+        "state": "Kerala",
+        "district": "Kochi",
+        "category": "environment",
+        "source": "The Hindu",
+        "url": "https://www.thehindu.com/news/national/kerala/heavy-rain-kochi/article1.ece",
+        "published_at": now,
+        "scraped_at": now,
+        "is_global": False,
+        "cluster_id": str(uuid.uuid4()),
+    }
+
+def before(raw_docs: list) -> bytes:
+    docs = [serialize_doc(bson.decode(raw)) for raw in raw_docs]
+    content = jsonable_encoder({"news": docs, "total": len(docs), "state": "Kerala"})
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+def after(raw_batch: bytes) -> bytes:
+    docs = bson.decode_all(raw_batch)
+    return orjson.dumps({"news": docs, "total": len(docs), "state": "Kerala"})
+
+def per_document(func, arg, docs: int, rounds: int) -> float:
+    func(arg)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(arg)
+    return (time.perf_counter() - start) / (rounds * docs)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=100, help="Documents per response (the API limit)")
+    parser.add_argument("--rounds", type=int, default=500)
+    parser.add_argument("--content-chars", type=int, nargs="+", default=[0, 2000, 10000])
+    args = parser.parse_args()
+    
+    print(f"{'content':>8} {'before':>10} {'after':>10} {'speedup':>8}")
+    for content_chars in args.content_chars:
+        docs = [stored_document(content_chars) for _ in range(args.docs)]
+        raw_docs = [bson.encode(doc) for doc in docs]
+        # What the server sends back for the projected query: one batch, no _id
+        raw_batch = b"".join(bson.encode({k: doc[k] for k in NEWS_FIELDS}) for doc in docs)
+        
+        cost_before = per_document(before, raw_docs, args.docs, args.rounds)
+        cost_after = per_document(after, raw_batch, args.docs, args.rounds)
+        print(
+            f"{content_chars:>8} {cost_before * 1e6:>8.2f}us {cost_after * 1e6:>8.2f}us "
+            f"{cost_before / cost_after:>7.1f}x"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Benchmark related-articles query latency as the TF-IDF corpus grows.
+
+Builds synthetic headline corpora (Zipf-distributed vocabulary, roughly the
+shape of real titles + summaries) and times RelatedArticlesIndex.related()
+for random items at each size. Run from the repository root:
+
+    python benchmarks/bench_related.py
+    python benchmarks/bench_related.py --sizes 1000 10000 100000 300000 --queries 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "benchmark")
+
+from server import RelatedArticlesIndex  # noqa: E402
+
+def synthetic_items(count: int, vocabulary_size: int, rng: np.random.Generator) -> list:
+    vocabulary = [f"term{i}" for i in range(vocabulary_size)]
+    lengths = rng.integers(8, 30, size=count)
+    words = rng.zipf(1.3, size=int(lengths.sum())) % vocabulary_size
+    items, offset = [], 0
+    for i, length in enumerate(lengths):
+        text = " ".join(vocabulary[w] for w in words[offset:offset + length])
+        offset += length
+        items.append({"id": f"item-{i}", "title": text[:80], "summary": text, "source": "bench"})
+    return items
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 300000])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--batch", type=int, default=500, help="Items per incremental add() call")
+    parser.add_argument("--vocabulary", type=int, default=50000)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(7)
+    print(f"{'docs':>8} {'nnz':>10} {'add/item':>10} {'reweight':>10} {'p50':>9} {'p95':>9} {'max':>9}")
+    for size in args.sizes:
+        items = synthetic_items(size, args.vocabulary, rng)
+        index = RelatedArticlesIndex(max_docs=size)
+        
+        start = time.perf_counter()
+        for offset in range(0, size, args.batch):
+            index.add(items[offset:offset + args.batch])
+        add_per_item = (time.perf_counter() - start) / size
+        
+        start = time.perf_counter()
+        index.reweight_now()
+        reweight = time.perf_counter() - start
+        
+        latencies = []
+        for row in rng.integers(0, size, size=args.queries):
+            start = time.perf_counter()
+            index.related(items[row]["id"], 10)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        
+        print(
+            f"{size:>8} {index.counts.nnz:>10} {add_per_item * 1e6:>8.1f}us {reweight * 1e3:>8.1f}ms "
+            f"{statistics.median(latencies) * 1e3:>7.2f}ms {latencies[int(len(latencies) * 0.95) - 1] * 1e3:>7.2f}ms "
+            f"{latencies[-1] * 1e3:>7.2f}ms"
+        )
+
+if __name__ == "__main__":
+    main()
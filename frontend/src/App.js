@@ -13,6 +13,8 @@ function App() {
   const [selectedState, setSelectedState] = useState("");
   const [states, setStates] = useState({});
   const [error, setError] = useState("");
+  const [suggestions, setSuggestions] = useState([]);
+  const [showSuggestions, setShowSuggestions] = useState(false);
 
   const indianStates = [
     "Andhra Pradesh", "Arunachal Pradesh", "Assam", "Bihar", "Chhattisgarh",
@@ -28,6 +30,32 @@ function App() {
     fetchStates();
   }, []);
 
+  // Autocomplete while typing, debounced so fast typists don't fire a request per key
+  useEffect(() => {
+    const prefix = searchQuery.trim();
+    if (!prefix) {
+      setSuggestions([]);
+      return;
+    }
+
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const response = await axios.get(`${API}/news/suggest`, {
+          params: { prefix, limit: 8 }
+        });
+        if (!cancelled) setSuggestions(response.data.suggestions || []);
+      } catch (error) {
+        console.error("Error fetching suggestions:", error);
+      }
+    }, 150);
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [searchQuery]);
+
   const fetchStates = async () => {
     try {
       const response = await axios.get(`${API}/states`);
@@ -68,15 +96,16 @@ function App() {
     }
   };
 
-  const searchNews = async () => {
-    if (!searchQuery.trim()) return;
+  const searchNews = async (query = searchQuery) => {
+    if (!query.trim()) return;
     
+    setShowSuggestions(false);
     setLoading(true);
     setError("");
     
     try {
       const response = await axios.get(`${API}/news/search`, {
-        params: { q: searchQuery }
+        params: { q: query }
       });
       setNews(response.data.news || []);
       setActiveTab("search");
@@ -116,6 +145,16 @@ function App() {
     fetchNews("state", state);
   };
 
+  const selectSuggestion = (suggestion) => {
+    if (suggestion.kind === "state") {
+      setShowSuggestions(false);
+      handleStateChange(suggestion.text);
+      return;
+    }
+    setSearchQuery(suggestion.text);
+    searchNews(suggestion.text);
+  };
+
   const formatDate = (dateString) => {
     const date = new Date(dateString);
     return date.toLocaleDateString("en-IN", {
@@ -158,17 +197,37 @@ function App() {
             </div>
             
             {/* Search Bar */}
-            <div className="flex gap-2 max-w-md">
+            <div className="relative flex gap-2 max-w-md">
               <input
                 type="text"
                 placeholder="Search news (e.g., 'NEET exam', 'economy')"
                 value={searchQuery}
-                onChange={(e) => setSearchQuery(e.target.value)}
+                onChange={(e) => {
+                  setSearchQuery(e.target.value);
+                  setShowSuggestions(true);
+                }}
                 onKeyPress={(e) => e.key === "Enter" && searchNews()}
+                onBlur={() => setTimeout(() => setShowSuggestions(false), 150)}
                 className="flex-1 px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-indigo-500 focus:border-transparent"
               />
+              {showSuggestions && suggestions.length > 0 && (
+                <ul className="absolute left-0 right-14 top-full mt-1 z-10 bg-white border border-gray-200 rounded-lg shadow-lg overflow-hidden">
+                  {suggestions.map((suggestion) => (
+                    <li
+                      key={`${suggestion.kind}-${suggestion.text}`}
+                      onMouseDown={() => selectSuggestion(suggestion)}
+                      className="px-4 py-2 cursor-pointer hover:bg-indigo-50 flex justify-between"
+                    >
+                      <span className="text-gray-900">{suggestion.text}</span>
+                      {suggestion.kind !== "term" && (
+                        <span className="text-xs text-gray-500 capitalize">{suggestion.kind}</span>
+                      )}
+                    </li>
+                  ))}
+                </ul>
+              )}
               <button
-                onClick={searchNews}
+                onClick={() => searchNews()}
                 className="px-6 py-2 bg-indigo-600 text-white rounded-lg hover:bg-indigo-700 transition-colors"
               >
                 🔍
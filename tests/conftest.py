@@ -0,0 +1,162 @@
+import re
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Offline tests import the backend module directly
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+import server
+
+def get_path(doc: dict, path: str):
+    for part in path.split("."):
+        if not isinstance(doc, dict) or part not in doc:
+            return None
+        doc = doc[part]
+    return doc
+
+def set_path(doc: dict, path: str, value):
+    *parents, last = path.split(".")
+    for part in parents:
+        doc = doc.setdefault(part, {})
+    doc[last] = value
+
+def matches(doc: dict, query: dict) -> bool:
+    for field, condition in query.items():
+        value = get_path(doc, field)
+        if isinstance(condition, dict):
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+            if "$gte" in condition and (value is None or value < condition["$gte"]):
+                return False
+            if "$lte" in condition and (value is None or value > condition["$lte"]):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+    
+    def sort(self, field: str, direction: int = 1):
+        self.docs.sort(key=lambda doc: doc.get(field), reverse=direction < 0)
+        return self
+    
+    def limit(self, count: int):
+        self.docs = self.docs[:count] if count else self.docs
+        return self
+    
+    async def to_list(self, length=None):
+        return self.docs[:length] if length else list(self.docs)
+    
+    def __aiter__(self):
+        return self.iterate()
+    
+    async def iterate(self):
+        for doc in self.docs:
+            yield doc
+
+class FakeCollection:
+    """Just enough of a Motor collection for the ingest code paths under test"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.docs = []
+    
+    def find(self, query: dict, projection: dict = None):
+        found = [doc for doc in self.docs if matches(doc, query)]
+        included = {k for k, v in (projection or {}).items() if v}
+        if included:
+            found = [{k: v for k, v in doc.items() if k in included} for doc in found]
+        return FakeCursor(found)
+    
+    async def create_index(self, *args, **kwargs):
+        pass
+    
+    async def update_many(self, query: dict, update: dict):
+        for doc in self.docs:
+            if matches(doc, query):
+                self.apply(doc, update, False)
+    
+    async def find_one(self, query: dict, projection: dict = None):
+        doc = next((doc for doc in self.docs if matches(doc, query)), None)
+        if doc is None or not projection:
+            return doc
+        if any(projection.values()):
+            return {k: v for k, v in doc.items() if projection.get(k) or k == "_id"}
+        return {k: v for k, v in doc.items() if k not in projection}
+    
+    def apply(self, doc: dict, update: dict, inserted: bool):
+        for path, value in update.get("$setOnInsert", {}).items():
+            if inserted:
+                set_path(doc, path, value)
+        for path, value in update.get("$set", {}).items():
+            set_path(doc, path, value)
+        for path, value in update.get("$inc", {}).items():
+            set_path(doc, path, (get_path(doc, path) or 0) + value)
+        for path, value in update.get("$max", {}).items():
+            current = get_path(doc, path)
+            set_path(doc, path, value if current is None else max(current, value))
+        for path, values in update.get("$addToSet", {}).items():
+            current = get_path(doc, path) or []
+            set_path(doc, path, current + [v for v in values["$each"] if v not in current])
+        for path, push in update.get("$push", {}).items():
+            entries = (get_path(doc, path) or []) + push["$each"]
+            for field, direction in push.get("$sort", {}).items():
+                entries.sort(key=lambda e: e[field], reverse=direction < 0)
+            set_path(doc, path, entries[:push["$slice"]] if "$slice" in push else entries)
+    
+    async def update_one(self, query: dict, update: dict, upsert: bool = False):
+        if not update or any(not fields for fields in update.values()):
+            raise ValueError("update operators must not be empty")
+        doc = next((doc for doc in self.docs if matches(doc, query)), None)
+        inserted = doc is None
+        if inserted:
+            if not upsert:
+                return SimpleNamespace(upserted_id=None, matched_count=0)
+            doc = {k: v for k, v in query.items() if not isinstance(v, dict)}
+            self.docs.append(doc)
+        self.apply(doc, update, inserted)
+        return SimpleNamespace(upserted_id=doc.get("_id", doc.get("id")) if inserted else None,
+                               matched_count=0 if inserted else 1)
+    
+    async def bulk_write(self, operations, ordered: bool = True):
+        upserted_ids = {}
+        for index, operation in enumerate(operations):
+            result = await self.update_one(operation._filter, operation._doc, operation._upsert)
+            if result.upserted_id is not None:
+                upserted_ids[index] = result.upserted_id
+        return SimpleNamespace(upserted_ids=upserted_ids)
+
+class FakeDatabase:
+    def __init__(self):
+        self.collections = {}
+    
+    async def list_collection_names(self, filter: dict = None):
+        pattern = (filter or {}).get("name", {}).get("$regex", "")
+        return [name for name in self.collections if re.match(pattern, name)]
+    
+    async def drop_collection(self, name: str):
+        self.collections.pop(name, None)
+    
+    def __getitem__(self, name: str) -> FakeCollection:
+        return self.collections.setdefault(name, FakeCollection(name))
+    
+    def __getattr__(self, name: str) -> FakeCollection:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self[name]
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """Swap the server's MongoDB handle for an in-memory fake"""
+    database = FakeDatabase()
+    monkeypatch.setattr(server, "db", database)
+    
+    async def get_partition(name):
+        return database[name]
+    
+    monkeypatch.setattr(server, "get_partition", get_partition)
+    return database
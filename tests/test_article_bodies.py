@@ -0,0 +1,119 @@
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+
+import server
+from server import QueryResultCache, RelatedArticlesIndex, StoryClusterIndex, SuggestionTrie
+
+ARTICLE = "<html><body><article>" + "".join(
+    f"<p>The state cabinet approved the irrigation scheme, officials said, in phase {i} of the plan.</p>" for i in range(4)
+) + "</article></body></html>"
+
+def make_item(item_id: str, title: str, url: str) -> dict:
+    now = datetime.utcnow().isoformat()
+    return {
+        "id": item_id, "title": title, "summary": title, "source": "NDTV", "url": url,
+        "state": None, "district": None, "category": "general", "is_global": False,
+        "published_at": now, "scraped_at": now
+    }
+
+@pytest.fixture
+def pipeline(fake_db, monkeypatch):
+    """Run the ingest pipeline against the fake database with fresh indexes"""
+    for name, index in (("story_index", StoryClusterIndex()), ("related_index", RelatedArticlesIndex()),
+                        ("suggestion_trie", SuggestionTrie()), ("query_cache", QueryResultCache()),
+                        ("trending_tracker", server.TrendingTracker())):
+        monkeypatch.setattr(server, name, index)
+    monkeypatch.setattr(server, "news_cache", {"global": [], "india": [], "last_updated": None})
+    monkeypatch.setattr(server, "NEWS_SOURCES", {"global": [], "indian": [{"name": "NDTV"}]})
+    monkeypatch.setattr(server, "ARTICLE_HOST_DELAY_SECONDS", 0)
+    
+    scraped = []
+    
+    async def scrape_news_from_source(source, is_global=False):
+        return [dict(item) for item in scraped]
+    
+    background = []
+    monkeypatch.setattr(server, "scrape_news_from_source", scrape_news_from_source)
+    monkeypatch.setattr(server, "run_in_background", background.append)
+    return scraped, background
+
+def serve_articles(monkeypatch, responses: dict):
+    """Answer article fetches from a dict of url -> (status, body)"""
+    def handler(request):
+        status, body = responses[str(request.url)]
+        return httpx.Response(status, text=body)
+    
+    client_class = httpx.AsyncClient
+    monkeypatch.setattr(server.httpx, "AsyncClient",
+                        lambda **kwargs: client_class(transport=httpx.MockTransport(handler), **kwargs))
+
+def refresh(background):
+    """One scheduled refresh, then the background body fetch it started"""
+    async def run():
+        await server.update_news_cache()
+        while background:
+            await background.pop()
+    asyncio.run(run())
+
+class TestArticleBodies:
+    """Offline tests for attaching and fetching article bodies during ingest"""
+    
+    def test_new_headline_for_fetched_url_is_archived_with_body(self, pipeline, fake_db, monkeypatch):
+        scraped, background = pipeline
+        url = "https://example.com/cabinet"
+        serve_articles(monkeypatch, {url: (200, ARTICLE)})
+        
+        scraped.append(make_item("first", "Cabinet approves irrigation scheme", url))
+        refresh(background)
+        # The headline is edited; same URL, new item id
+        scraped[:] = [make_item("edited", "Cabinet clears irrigation scheme for rural districts", url)]
+        refresh(background)
+        
+        docs = {doc["id"]: doc for doc in fake_db[server.partition_name(datetime.utcnow())].docs}
+        assert set(docs) == {"first", "edited"}
+        assert "irrigation scheme" in docs["edited"]["content"]
+        assert docs["edited"]["summary"] == docs["first"]["summary"] != "Cabinet approves irrigation scheme"
+    
+    def test_failed_fetches_are_retried_a_bounded_number_of_times(self, pipeline, fake_db, monkeypatch):
+        scraped, background = pipeline
+        monkeypatch.setattr(server, "ARTICLE_FETCH_MAX_ATTEMPTS", 3)
+        url = "https://example.com/flaky"
+        responses = {url: (503, "")}
+        serve_articles(monkeypatch, responses)
+        scraped.append(make_item("flaky", "Flood relief package announced for Assam", url))
+        
+        refresh(background)
+        assert fake_db.article_bodies.docs[0]["failed_attempts"] == 1
+        assert asyncio.run(server.attach_article_bodies([make_item("x", "t", url)])) == [url]
+        
+        # The next refresh retries and the body reaches the archived item
+        responses[url] = (200, ARTICLE)
+        refresh(background)
+        [body] = fake_db.article_bodies.docs
+        assert body["failed_attempts"] == 0 and "irrigation scheme" in body["content"]
+        [doc] = fake_db[server.partition_name(datetime.utcnow())].docs
+        assert doc["content"] == body["content"]
+        assert asyncio.run(server.attach_article_bodies([make_item("x", "t", url)])) == []
+    
+    def test_retries_stop_after_max_attempts(self, pipeline, fake_db, monkeypatch):
+        scraped, background = pipeline
+        monkeypatch.setattr(server, "ARTICLE_FETCH_MAX_ATTEMPTS", 3)
+        url = "https://example.com/gone"
+        serve_articles(monkeypatch, {url: (404, "")})
+        scraped.append(make_item("gone", "Metro line extension opens to the public", url))
+        
+        for _ in range(5):
+            refresh(background)
+        assert fake_db.article_bodies.docs[0]["failed_attempts"] == 3
+    
+    def test_pages_without_text_are_not_retried(self, fake_db):
+        fake_db.article_bodies.docs.extend([
+            {"url": "https://example.com/video", "content": None, "failed_attempts": 0},
+            {"url": "https://example.com/legacy", "content": None},
+        ])
+        items = [make_item("a", "t", "https://example.com/video"), make_item("b", "t", "https://example.com/legacy")]
+        # Rows from before failures were counted get one more try
+        assert asyncio.run(server.attach_article_bodies(items)) == ["https://example.com/legacy"]
@@ -0,0 +1,51 @@
+import time
+
+from bs4 import BeautifulSoup
+
+from server import extract_article_text
+
+PARAGRAPH = ("The state government said on Tuesday that the new policy, which covers irrigation, "
+             "rural roads and school buildings, would be rolled out in three phases over two years.")
+
+def news_page(paragraphs: int = 1200, related_links: int = 600) -> str:
+    """A site-wrapper page: every block sits a few levels under one big page div"""
+    body = "".join(f"<div class='copy'><p>{PARAGRAPH} Update {i}.</p></div>" for i in range(paragraphs))
+    links = "".join(f"<li><a href='/story/{i}'>Related story number {i}</a></li>" for i in range(related_links))
+    return (
+        "<html><head><title>Policy</title><script>var tracking = 1;</script></head><body>"
+        "<div id='page'><nav>Home | India | World</nav>"
+        f"<main><article><h1>New rural policy</h1>{body}</article></main>"
+        f"<aside><ul>{links}</ul></aside><footer>Copyright</footer></div></body></html>"
+    )
+
+class TestExtractArticleText:
+    """Offline tests for article body extraction"""
+    
+    def test_large_nested_page_extracts_quickly(self):
+        html = news_page()
+        assert len(html) > 250_000
+        
+        started = time.perf_counter()
+        BeautifulSoup(html, 'html.parser')
+        parse_time = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        text = extract_article_text(html)
+        elapsed = time.perf_counter() - started
+        
+        assert text.count(PARAGRAPH) == 1200
+        assert "Related story" not in text and "tracking" not in text
+        # Scoring must stay linear in the page size; re-rendering subtrees
+        # per score update took hundreds of times the parse time
+        assert elapsed < 10 * parse_time + 0.5
+    
+    def test_identical_blocks_are_scored_separately(self):
+        repeated = f"<section><div class='promo'><p>{PARAGRAPH} Promo.</p><p>{PARAGRAPH} Promo.</p></div></section>"
+        article = "".join(f"<p>{PARAGRAPH} Story {i}.</p>" for i in range(3))
+        html = f"<html><body>{repeated}{repeated}<section><div class='story'>{article}</div></section></body></html>"
+        
+        text = extract_article_text(html)
+        assert "Story 0" in text and "Promo" not in text
+    
+    def test_falls_back_to_nothing_without_paragraphs(self):
+        assert extract_article_text("<html><body><p>Too short</p></body></html>") is None
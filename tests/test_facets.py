@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+import server
+from server import StoryClusterIndex, record_facets
+
+DAY = "2025-03-04"
+
+def report(item_id: str, title: str, source: str, state: str = "Kerala", hour: int = 8) -> dict:
+    return {
+        "id": item_id, "title": title, "source": source, "url": f"https://example.com/{item_id}",
+        "state": state, "category": "environment", "published_at": f"{DAY}T{hour:02d}:00:00",
+        "scraped_at": f"{DAY}T{hour:02d}:00:00"
+    }
+
+@pytest.fixture
+def story_index(monkeypatch):
+    index = StoryClusterIndex()
+    monkeypatch.setattr(server, "story_index", index)
+    return index
+
+def ingest(story_index, items):
+    for item in items:
+        item["cluster_id"] = story_index.assign(item["title"], item["source"], server.datetime.fromisoformat(item["scraped_at"]))
+    asyncio.run(record_facets(items))
+
+def top_ids(digest, path):
+    group, value = path.split(".")
+    return [entry["id"] for entry in digest[group][value]["top"]]
+
+class TestRecordFacets:
+    """Offline tests for facet counters and daily digests"""
+    
+    def test_counts_every_item_and_lists_each_story_once(self, fake_db, story_index):
+        ingest(story_index, [
+            report("ndtv-1", "Heavy rain shuts schools across Kochi district", "NDTV"),
+            report("hindu-1", "Heavy rain shuts schools across Kochi district today", "The Hindu"),
+            report("ndtv-2", "Kerala cabinet approves new coastal highway plan", "NDTV"),
+        ])
+        
+        digest = fake_db.daily_digests.docs[0]
+        assert digest["total"] == 3
+        assert digest["states"]["Kerala"]["count"] == 3
+        assert top_ids(digest, "states.Kerala") == ["ndtv-1", "ndtv-2"]
+        assert top_ids(digest, "categories.environment") == ["ndtv-1", "ndtv-2"]
+        
+        day_counts, overall = fake_db.facet_counts.docs
+        assert day_counts["_id"] == DAY and overall["_id"] == "all"
+        assert day_counts["source"] == {"NDTV": 2, "The Hindu": 1}
+        assert overall["total"] == 3
+    
+    def test_repeat_report_from_first_source_is_not_listed_again(self, fake_db, story_index):
+        ingest(story_index, [report("ndtv-1", "Heavy rain shuts schools across Kochi district", "NDTV")])
+        # The same source edits its headline in a later refresh: new item id, same story
+        ingest(story_index, [report("ndtv-1b", "Heavy rain shuts schools across Kochi district on Monday", "NDTV", hour=9)])
+        ingest(story_index, [report("bbc-1", "Heavy rain shuts schools across Kochi district", "BBC", hour=10)])
+        
+        digest = fake_db.daily_digests.docs[0]
+        assert digest["total"] == 3
+        assert top_ids(digest, "states.Kerala") == ["ndtv-1"]
+        assert top_ids(digest, "categories.environment") == ["ndtv-1"]
+        assert len(digest["cluster_ids"]) == 1
+    
+    def test_later_refresh_adds_new_stories(self, fake_db, story_index):
+        ingest(story_index, [report("ndtv-1", "Heavy rain shuts schools across Kochi district", "NDTV")])
+        ingest(story_index, [report("ndtv-2", "Kerala cabinet approves new coastal highway plan", "NDTV", hour=9)])
+        
+        digest = fake_db.daily_digests.docs[0]
+        # Newest first
+        assert top_ids(digest, "states.Kerala") == ["ndtv-2", "ndtv-1"]
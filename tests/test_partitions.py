@@ -0,0 +1,85 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import server
+from server import partition_name, partitions_for_range, previous_partition, published_range_filter
+
+def make_item(item_id: str, published_at: datetime, title: str = "Headline") -> dict:
+    return {
+        "id": item_id, "title": title, "summary": title, "source": "NDTV", "url": f"https://example.com/{item_id}",
+        "state": None, "district": None, "category": "general", "is_global": False,
+        "published_at": published_at.isoformat(), "scraped_at": published_at.isoformat()
+    }
+
+class TestPartitionRouting:
+    """Offline tests for monthly archive partition selection"""
+    
+    def test_range_crosses_year_boundary(self, monkeypatch):
+        monkeypatch.setattr(server, "NEWS_RETENTION_DAYS", 100000)
+        names = partitions_for_range(datetime(2024, 11, 20), datetime(2025, 2, 3))
+        assert names == ["news_202502", "news_202501", "news_202412", "news_202411"]
+        assert previous_partition("news_202501") == "news_202412"
+        assert previous_partition("news_202503") == "news_202502"
+    
+    def test_single_month_and_aware_bounds(self, monkeypatch):
+        monkeypatch.setattr(server, "NEWS_RETENTION_DAYS", 100000)
+        assert partitions_for_range(datetime(2025, 3, 2), datetime(2025, 3, 30)) == ["news_202503"]
+        # 00:30 on 1 April in India is still March in UTC
+        ist = timezone(timedelta(hours=5, minutes=30))
+        assert partitions_for_range(datetime(2025, 3, 2), datetime(2025, 4, 1, 0, 30, tzinfo=ist)) == ["news_202503"]
+    
+    def test_start_is_clamped_to_retention(self, monkeypatch):
+        monkeypatch.setattr(server, "NEWS_RETENTION_DAYS", 60)
+        now = datetime.utcnow()
+        names = partitions_for_range(datetime(2000, 1, 1))
+        assert names[0] == partition_name(now)
+        assert names[-1] == partition_name(now - timedelta(days=60))
+        assert names == sorted(names, reverse=True)
+        # No start at all means the whole retention window
+        assert partitions_for_range() == names
+    
+    def test_published_range_filter(self):
+        ist = timezone(timedelta(hours=5, minutes=30))
+        assert published_range_filter() == {}
+        assert published_range_filter(datetime(2025, 1, 1, 5, 30, tzinfo=ist)) == {
+            "published_at": {"$gte": "2025-01-01T00:00:00"}
+        }
+        assert published_range_filter(datetime(2025, 1, 1), datetime(2025, 1, 31, 23, 59)) == {
+            "published_at": {"$gte": "2025-01-01T00:00:00", "$lte": "2025-01-31T23:59:00"}
+        }
+
+class TestUpsertNewsItems:
+    """Offline tests for writing items to their archive partitions"""
+    
+    def test_items_go_to_their_published_month(self, fake_db):
+        items = [
+            make_item("a", datetime(2024, 12, 31, 23, 0)),
+            make_item("b", datetime(2025, 1, 1, 1, 0)),
+            make_item("b", datetime(2025, 1, 1, 1, 0)),
+        ]
+        new_items = asyncio.run(server.upsert_news_items(items))
+        
+        assert sorted(item["id"] for item in new_items) == ["a", "b"]
+        assert [doc["id"] for doc in fake_db["news_202412"].docs] == ["a"]
+        assert [doc["id"] for doc in fake_db["news_202501"].docs] == ["b"]
+    
+    def test_item_seen_last_month_stays_there(self, fake_db):
+        asyncio.run(server.upsert_news_items([make_item("a", datetime(2024, 12, 31, 23, 0), "First title")]))
+        
+        # Re-scraped after the month boundary, with fresh timestamps and tags
+        rescraped = make_item("a", datetime(2025, 1, 1, 0, 30), "First title")
+        rescraped["category"] = "politics"
+        new_items = asyncio.run(server.upsert_news_items([rescraped, make_item("c", datetime(2025, 1, 1, 0, 30))]))
+        
+        assert [item["id"] for item in new_items] == ["c"]
+        assert [doc["id"] for doc in fake_db["news_202501"].docs] == ["c"]
+        [doc] = fake_db["news_202412"].docs
+        # First-seen fields are kept, tags and the last sighting are refreshed
+        assert doc["published_at"] == "2024-12-31T23:00:00"
+        assert doc["category"] == "politics"
+        assert doc["last_seen_at"] == "2025-01-01T00:30:00"
+    
+    def test_backfill_does_not_rewind_last_seen(self, fake_db):
+        asyncio.run(server.upsert_news_items([make_item("a", datetime(2025, 1, 10))]))
+        asyncio.run(server.upsert_news_items([make_item("a", datetime(2025, 1, 5))]))
+        assert fake_db["news_202501"].docs[0]["last_seen_at"] == "2025-01-10T00:00:00"
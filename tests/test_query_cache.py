@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from server import QueryResultCache
+
+class TestQueryResultCache:
+    """Offline tests for the archive query result cache"""
+    
+    def test_concurrent_misses_share_one_load(self):
+        async def scenario():
+            cache = QueryResultCache()
+            calls = []
+            
+            async def loader():
+                calls.append(1)
+                await asyncio.sleep(0.01)
+                return ["result"]
+            
+            results = await asyncio.gather(*[cache.get_or_load(("k",), loader) for _ in range(20)])
+            again = await cache.get_or_load(("k",), loader)
+            return calls, results, again, cache.stats()
+        
+        calls, results, again, stats = asyncio.run(scenario())
+        assert len(calls) == 1
+        assert all(result == ["result"] for result in results)
+        assert again == ["result"]
+        assert (stats["misses"], stats["collapsed"], stats["hits"]) == (1, 19, 1)
+    
+    def test_waiters_survive_owner_cancellation(self):
+        async def scenario():
+            cache = QueryResultCache()
+            calls = []
+            
+            async def loader():
+                calls.append(1)
+                await asyncio.sleep(0.05)
+                return len(calls)
+            
+            owner = asyncio.create_task(cache.get_or_load(("k",), loader))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(cache.get_or_load(("k",), loader))
+            await asyncio.sleep(0)
+            owner.cancel()
+            
+            result = await asyncio.wait_for(waiter, timeout=1)
+            return owner, result, cache
+        
+        owner, result, cache = asyncio.run(scenario())
+        assert owner.cancelled()
+        # The waiter retried the load itself instead of hanging
+        assert result == 2
+        assert not cache.inflight
+    
+    def test_errors_reach_every_waiter(self):
+        async def scenario():
+            cache = QueryResultCache()
+            
+            async def loader():
+                await asyncio.sleep(0.01)
+                raise ValueError("database down")
+            
+            return await asyncio.gather(
+                *[cache.get_or_load(("k",), loader) for _ in range(3)], return_exceptions=True
+            ), cache
+        
+        results, cache = asyncio.run(scenario())
+        assert all(isinstance(result, ValueError) for result in results)
+        assert not cache.entries and not cache.inflight
+    
+    def test_invalidation_during_load_is_not_stored(self):
+        async def scenario():
+            cache = QueryResultCache()
+            
+            async def loader():
+                await asyncio.sleep(0.01)
+                return "stale"
+            
+            task = asyncio.create_task(cache.get_or_load(("k",), loader))
+            await asyncio.sleep(0)
+            cache.invalidate()
+            return await task, cache
+        
+        result, cache = asyncio.run(scenario())
+        assert result == "stale"
+        assert ("k",) not in cache.entries
+    
+    @pytest.mark.parametrize("ttl, max_entries", [(0.01, 10), (60, 1)])
+    def test_expiry_and_eviction(self, ttl, max_entries):
+        async def scenario():
+            cache = QueryResultCache(max_entries=max_entries, ttl_seconds=ttl)
+            
+            async def loader():
+                return "value"
+            
+            await cache.get_or_load(("a",), loader)
+            await cache.get_or_load(("b",), loader)
+            await asyncio.sleep(0.02)
+            await cache.get_or_load(("a",), loader)
+            return cache.stats()
+        
+        stats = asyncio.run(scenario())
+        assert stats["hits"] == 0
+        assert stats["misses"] == 3
@@ -0,0 +1,58 @@
+import asyncio
+
+import numpy as np
+
+from server import RelatedArticlesIndex
+
+ITEMS = [
+    {"id": "isro-1", "title": "ISRO launches Chandrayaan-4 lunar mission", "summary": "ISRO launches Chandrayaan-4"},
+    {"id": "isro-2", "title": "Chandrayaan-4 lunar lander separates", "summary": "Chandrayaan-4 lunar lander"},
+    {"id": "rain-1", "title": "Heavy rain shuts Kochi schools", "summary": "Heavy rain shuts Kochi schools"},
+    {"id": "rain-2", "title": "Kochi rain alert extended", "summary": "Kochi rain alert"},
+]
+
+class TestRelatedArticlesIndex:
+    """Offline tests for the related-articles TF-IDF index"""
+    
+    def test_related_ranks_shared_terms(self):
+        index = RelatedArticlesIndex()
+        index.add(ITEMS)
+        index.reweight_now()
+        
+        related = index.related("isro-1", 3)
+        assert related[0]["id"] == "isro-2"
+        assert all(item["id"] != "isro-1" for item in related)
+        assert index.related("unknown") is None
+    
+    def test_queries_use_old_snapshot_until_reweighted(self):
+        index = RelatedArticlesIndex()
+        index.add(ITEMS[:2])
+        index.reweight_now()
+        served = index.served
+        
+        index.add(ITEMS[2:])
+        # New rows are not visible until the next snapshot is installed
+        assert index.served is served
+        assert index.related("rain-1") is None
+        assert index.related("isro-1")[0]["id"] == "isro-2"
+        
+        asyncio.run(index.reweight())
+        assert index.related("rain-1")[0]["id"] == "rain-2"
+    
+    def test_update_matches_fresh_index(self):
+        """Replacing a row's summary gives the same matrix as indexing it fresh"""
+        bodies = {"id": "rain-2", "title": "Kochi rain alert extended", "summary": "IMD extends red alert as rain lashes Kochi"}
+        
+        updated = RelatedArticlesIndex()
+        updated.add(ITEMS)
+        assert updated.update([bodies]) == 1
+        assert updated.update([bodies]) == 0
+        updated.reweight_now()
+        
+        fresh = RelatedArticlesIndex()
+        fresh.add(ITEMS[:3] + [bodies])
+        fresh.reweight_now()
+        
+        assert updated.served["docs"][3]["summary"] == bodies["summary"]
+        assert np.array_equal(updated.doc_freq, fresh.doc_freq)
+        assert np.allclose(updated.served["matrix"].toarray(), fresh.served["matrix"].toarray())
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import server
+from server import StoryClusterIndex, collapse_story_clusters
+
+START = datetime(2025, 3, 1, 8, 0)
+
+class TestStoryClusterIndex:
+    """Offline tests for near-duplicate story clustering"""
+    
+    def test_near_duplicates_share_a_cluster(self):
+        index = StoryClusterIndex()
+        first = index.assign("ISRO launches Chandrayaan-4 mission to the Moon", "NDTV", START)
+        second = index.assign("ISRO launches Chandrayaan-4 mission to the Moon today", "The Hindu", START)
+        other = index.assign("Heavy rain shuts schools across Kochi district", "NDTV", START)
+        
+        assert first == second
+        assert other != first
+        assert index.sources(first) == ["NDTV", "The Hindu"]
+        # A source repeating itself is listed once
+        index.assign("ISRO launches Chandrayaan-4 mission to the Moon", "NDTV", START)
+        assert index.sources(first) == ["NDTV", "The Hindu"]
+    
+    def test_known_cluster_id_is_kept(self):
+        index = StoryClusterIndex()
+        cluster_id = index.assign("Parliament passes the new data protection bill", "NDTV", START, "archived-id")
+        assert cluster_id == "archived-id"
+        # Later near-duplicates join the reloaded cluster
+        assert index.assign("Parliament passes new data protection bill", "BBC", START) == "archived-id"
+    
+    def test_evict_stale_drops_old_stories(self):
+        index = StoryClusterIndex(window_hours=72)
+        old = index.assign("Monsoon reaches Kerala three days early", "NDTV", START)
+        recent = index.assign("Sensex closes at a record high on bank rally", "NDTV", START + timedelta(hours=70))
+        index.assign("Budget session of Parliament begins next week", "NDTV", START + timedelta(hours=73))
+        index.evict_stale()
+        
+        assert index.sources(old) == []
+        assert index.sources(recent) == ["NDTV"]
+        assert all(old not in bucket for bucket in index.buckets.values())
+        # An evicted story comes back as a new cluster
+        assert index.assign("Monsoon reaches Kerala three days early", "BBC", START + timedelta(hours=73)) != old
+    
+    def test_evicting_an_empty_index_is_a_no_op(self):
+        index = StoryClusterIndex()
+        index.evict_stale()
+        assert index.clusters == {}
+
+def make_items(cluster_ids):
+    return [
+        {"_id": i, "id": f"item-{i}", "title": f"Headline {i}", "source": "NDTV", "cluster_id": cluster_id}
+        for i, cluster_id in enumerate(cluster_ids)
+    ]
+
+class TestCollapseStoryClusters:
+    """Offline tests for collapsing feeds to one item per story"""
+    
+    def test_keeps_first_item_per_cluster(self):
+        stories = collapse_story_clusters(make_items(["a", "a", "b", None, "b", "c"]), 10)
+        assert [s["id"] for s in stories] == ["item-0", "item-2", "item-3", "item-5"]
+        assert all("_id" not in s for s in stories)
+        assert all(s["sources"] == ["NDTV"] for s in stories)
+    
+    def test_stops_at_limit(self):
+        stories = collapse_story_clusters(make_items(["a", "b", "c", "d"]), 2)
+        assert [s["cluster_id"] for s in stories] == ["a", "b"]
+    
+    def test_archive_stories_fill_the_limit(self, monkeypatch):
+        # Every story appears three times in a row, newest first
+        rows = make_items([f"story-{i // 3}" for i in range(300)])
+        fetched = []
+        
+        async def fake_find_archived_news(query, limit, start=None, end=None):
+            fetched.append(limit)
+            return rows[:limit]
+        
+        monkeypatch.setattr(server, "find_archived_news", fake_find_archived_news)
+        stories = asyncio.run(server.find_archived_stories({}, 20, START))
+        assert [s["cluster_id"] for s in stories] == [f"story-{i}" for i in range(20)]
+        assert fetched == [80]
+        
+        # Heavier duplication reads further until the page is full
+        rows[:] = make_items([f"story-{i // 10}" for i in range(1000)])
+        fetched.clear()
+        stories = asyncio.run(server.find_archived_stories({}, 20, START))
+        assert len(stories) == 20
+        assert fetched == [80, 320]
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import server
+from server import SuggestionTrie
+
+def trie_with(*terms):
+    trie = SuggestionTrie()
+    for term, weight in terms:
+        trie.add(term, weight=weight)
+    return trie
+
+def texts(suggestions):
+    return [s["text"] for s in suggestions]
+
+class TestSuggestionTrie:
+    """Offline tests for search-box autocomplete"""
+    
+    def test_exact_prefix_ranks_by_weight_then_text(self):
+        trie = trie_with(("monsoon", 5), ("modi", 9), ("mobile", 5), ("kerala", 20))
+        assert texts(trie.suggest("mo")) == ["modi", "mobile", "monsoon"]
+        assert texts(trie.suggest("  MON ")) == ["monsoon"]
+        assert all(s["distance"] == 0 for s in trie.suggest("mo"))
+        assert texts(trie.suggest("mo", limit=1)) == ["modi"]
+        assert trie.suggest("") == []
+    
+    def test_exact_matches_come_before_fuzzy_ones(self):
+        trie = trie_with(("monsoon", 1), ("monsoons", 1), ("monroe", 50))
+        # "monso" matches two terms exactly; "monroe" is one edit away but heavier
+        assert texts(trie.suggest("monso")) == ["monsoon", "monsoons", "monroe"]
+        assert [s["distance"] for s in trie.suggest("monso")] == [0, 0, 1]
+    
+    def test_fuzzy_search_is_anchored_on_the_first_two_characters(self):
+        trie = trie_with(("chandrayaan", 3), ("shandrayaan", 3))
+        # A typo after the anchor is forgiven
+        assert texts(trie.suggest("chendrayaan")) == ["chandrayaan"]
+        # A typo inside the anchor is not, even though it is one edit away
+        assert texts(trie.suggest("xhandrayaan")) == []
+        assert texts(trie.suggest("cxandrayaan")) == []
+    
+    def test_edit_budget_grows_with_prefix_length(self):
+        trie = trie_with(("kerala", 1), ("parliament", 1))
+        # Under four characters: exact only
+        assert texts(trie.suggest("kee")) == []
+        # Four to seven: one edit
+        assert texts(trie.suggest("kerela")) == ["kerala"]
+        assert texts(trie.suggest("keeela")) == []
+        # Eight and over: two edits
+        assert texts(trie.suggest("parlaimen")) == ["parliament"]
+        assert trie.suggest("parlaimen")[0]["distance"] == 2
+        assert texts(trie.suggest("paxlaimen")) == []
+    
+    def test_places_keep_their_kind_over_headline_terms(self):
+        trie = SuggestionTrie()
+        trie.add("kochi")
+        trie.add("Kochi", "district", 25)
+        trie.add("kochi")
+        [suggestion] = trie.suggest("koc")
+        assert suggestion == {"text": "Kochi", "kind": "district", "distance": 0}
+        assert trie.terms["kochi"]["weight"] == 27
+    
+    def test_expired_partitions_take_their_weight_back(self):
+        trie = SuggestionTrie()
+        trie.add("Kochi", "district", 25)
+        trie.add_items([
+            {"title": "Kochi metro extension opens", "published_at": "2024-01-05T10:00:00"},
+            {"title": "Kochi metro ridership climbs", "published_at": "2024-02-05T10:00:00"},
+            {"title": "Kolkata markets shut for strike", "published_at": "2024-01-06T10:00:00"},
+        ])
+        assert texts(trie.suggest("ko")) == ["Kochi", "kolkata"]
+        assert trie.terms["metro"]["weight"] == 2
+        
+        trie.expire({"news_202401"})
+        # Terms only seen in the dropped month are gone; shared ones lose that month's weight
+        assert "kolkata" not in trie.terms
+        assert texts(trie.suggest("ko")) == ["Kochi"]
+        assert texts(trie.suggest("kolkat")) == []
+        assert trie.terms["metro"]["weight"] == 1
+        assert trie.terms["kochi"]["weight"] == 26
+        
+        trie.expire({"news_202402"})
+        # Place names are permanent
+        assert trie.terms["kochi"]["weight"] == 25
+        assert "metro" not in trie.terms
+    
+    def test_dropping_partitions_expires_suggestions(self, fake_db, monkeypatch):
+        trie = SuggestionTrie()
+        monkeypatch.setattr(server, "suggestion_trie", trie)
+        monkeypatch.setattr(server, "NEWS_RETENTION_DAYS", 30)
+        old = datetime.utcnow() - timedelta(days=90)
+        trie.add_items([{"title": "Solar eclipse visible across Gujarat", "published_at": old.isoformat()}])
+        fake_db[server.partition_name(old)].docs.append({"id": "x"})
+        
+        asyncio.run(server.drop_expired_partitions())
+        assert server.partition_name(old) not in fake_db.collections
+        assert trie.suggest("ecli") == []
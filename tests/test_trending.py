@@ -0,0 +1,134 @@
+import asyncio
+import random
+import string
+from datetime import datetime, timedelta
+
+import server
+from server import CountMinSketch, TrendingTracker
+
+class TestCountMinSketch:
+    """Offline tests for the trending count-min sketch"""
+    
+    def test_rows_hash_independently(self):
+        """Keys colliding in one row should almost never collide in every row"""
+        rng = random.Random(0)
+        keys = {"".join(rng.choice(string.ascii_lowercase) for _ in range(7)) for _ in range(3000)}
+        sketch = CountMinSketch(width=2048, depth=4)
+        columns = [tuple(sketch.columns(key)) for key in keys]
+        
+        first_row = {c[0] for c in columns}
+        all_rows = set(columns)
+        
+        # A single row saturates well below len(keys); four independent rows don't
+        assert len(first_row) < 0.6 * len(keys)
+        assert len(all_rows) > 0.99 * len(keys)
+        
+        # Row pairs agree on a key pair no more often than chance
+        pairs = [(columns[i], columns[i + 1]) for i in range(len(columns) - 1)]
+        same_row0 = [(a, b) for a, b in pairs if a[0] == b[0]]
+        assert all(a[1:] != b[1:] for a, b in same_row0)
+    
+    def test_estimates_never_undercount(self):
+        """Estimates are at least the true count and stay close for a sparse stream"""
+        rng = random.Random(1)
+        sketch = CountMinSketch(width=512, depth=4)
+        truth = {}
+        for _ in range(5000):
+            key = f"term{rng.randint(0, 999)}"
+            truth[key] = truth.get(key, 0) + 1
+            sketch.add(key)
+        
+        errors = [sketch.estimate(key) - count for key, count in truth.items()]
+        assert min(errors) >= 0
+        # Expected overcount per row is total / width (about 10 here)
+        assert sum(errors) / len(errors) < 10
+
+START = datetime(2025, 3, 4, 6, 0)
+WINDOWS = {"1h": (timedelta(minutes=5), 12)}
+
+def headline(item_id: str, title: str, minutes: float, state: str = None) -> dict:
+    return {"id": item_id, "title": title, "state": state, "scraped_at": (START + timedelta(minutes=minutes)).isoformat()}
+
+def terms(results):
+    return [r["term"] for r in results]
+
+class TestTrendingTracker:
+    """Offline tests for rising terms over bucketed windows"""
+    
+    def test_ring_rotates_and_drops_old_buckets(self):
+        tracker = TrendingTracker(WINDOWS)
+        for minute in range(0, 300, 5):
+            tracker.add(headline(f"h{minute}", "Cyclone warning issued for coast", minute))
+        
+        ring = tracker.buckets["1h"]
+        # Two windows of twelve 5-minute buckets
+        assert len(ring) == 24
+        assert ring[-1]["start"] == START + timedelta(minutes=295)
+        assert [b["start"] for b in ring] == sorted(b["start"] for b in ring)
+        # A late headline older than the ring is ignored rather than reviving a bucket
+        assert tracker.bucket_for("1h", START) is None
+    
+    def test_rising_terms_beat_steady_ones(self):
+        tracker = TrendingTracker(WINDOWS)
+        for i in range(6):
+            # Steady: the same mentions in the previous hour and this one
+            tracker.add(headline(f"old{i}", "Budget session continues in Parliament", i * 5))
+            tracker.add(headline(f"new{i}", "Budget session continues in Parliament", 60 + i * 5))
+        for i in range(4):
+            tracker.add(headline(f"quake{i}", "Earthquake jolts Guwahati residents", 70 + i * 5))
+        
+        results = tracker.trending("1h", now=START + timedelta(minutes=100))
+        assert set(terms(results)) == {"earthquake", "jolts", "guwahati", "residents"}
+        assert all((r["mentions"], r["previous"]) == (4, 0) for r in results)
+    
+    def test_old_mentions_decay_out_of_the_window(self):
+        tracker = TrendingTracker(WINDOWS)
+        for i in range(5):
+            tracker.add(headline(f"flood{i}", "Flood alert in Assam districts", i * 5))
+        
+        assert "flood" in terms(tracker.trending("1h", now=START + timedelta(minutes=30)))
+        # An hour later the same mentions are only the previous window
+        assert tracker.trending("1h", now=START + timedelta(minutes=90)) == []
+        # And the ring forgets them entirely after two windows
+        tracker.add(headline("later", "Unrelated market update", 200))
+        assert all(b["start"] > START for b in tracker.buckets["1h"])
+    
+    def test_scopes_split_by_state(self):
+        tracker = TrendingTracker(WINDOWS)
+        for i in range(3):
+            tracker.add(headline(f"kerala{i}", "Monsoon floods Kochi streets", i, state="Kerala"))
+            tracker.add(headline(f"goa{i}", "Tourism season opens in Panaji beaches", i, state="Goa"))
+            tracker.add(headline(f"world{i}", "Summit talks resume in Geneva", i))
+        now = START + timedelta(minutes=10)
+        
+        assert {"monsoon", "tourism", "summit"} <= set(terms(tracker.trending("1h", now=now)))
+        assert "monsoon" in terms(tracker.trending("1h", "Kerala", now=now))
+        assert not {"tourism", "summit"} & set(terms(tracker.trending("1h", "Kerala", now=now)))
+        assert tracker.trending("1h", "Bihar", now=now) == []
+    
+    def test_repeated_headline_counts_once(self):
+        tracker = TrendingTracker(WINDOWS)
+        for minute in range(0, 30, 5):
+            tracker.add(headline("same", "Chandrayaan lander touches down", minute))
+        tracker.add(headline("other", "Chandrayaan images released", 10))
+        [result] = [r for r in tracker.trending("1h", now=START + timedelta(minutes=30)) if r["term"] == "chandrayaan"]
+        assert result["mentions"] == 2
+    
+    def test_archive_reload_restores_previous_window(self, fake_db, monkeypatch):
+        monkeypatch.setattr(server, "trending_tracker", TrendingTracker())
+        monkeypatch.setattr(server, "related_index", server.RelatedArticlesIndex())
+        monkeypatch.setattr(server, "suggestion_trie", server.SuggestionTrie())
+        now = datetime.utcnow()
+        partition = fake_db[server.partition_name(now)]
+        for i in range(6):
+            # A story that peaked yesterday and is still steady today
+            for hours_ago in (30, 2):
+                at = (now - timedelta(hours=hours_ago, minutes=i)).isoformat()
+                partition.docs.append({"id": f"{hours_ago}-{i}", "title": "Metro fare hike protests continue", "state": None,
+                                       "summary": "", "scraped_at": at, "published_at": at})
+        
+        asyncio.run(server.rebuild_archive_indexes())
+        # Yesterday's mentions are back as the previous day, so the story is not "rising"
+        assert "metro" not in terms(server.trending_tracker.trending("24h"))
+        [week] = [r for r in server.trending_tracker.trending("7d") if r["term"] == "metro"]
+        assert week["mentions"] == 12